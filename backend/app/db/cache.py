@@ -1,64 +1,73 @@
 """Caching layer for NewsAPI.ai queries and article summaries."""
 
-import json
+import orjson
 from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional
 
-from .database import get_connection
+from .database import HAS_JSONB, borrow
 
 
 QUERY_CACHE_TTL_HOURS = 24
 
+# SQL is kept as module constants: sqlite3's statement cache is keyed on text.
+# result_json is stored as JSONB where SQLite supports it (read back through
+# json()), otherwise as the raw UTF-8 bytes from orjson.
+_SELECT_CACHED_QUERY = f"""
+    SELECT {"json(result_json)" if HAS_JSONB else "result_json"} AS result_json
+    FROM cached_queries
+    WHERE reporter_name = ? AND created_at > ?
+    ORDER BY created_at DESC LIMIT 1
+"""
+_UPSERT_CACHED_QUERY = f"""
+    INSERT OR REPLACE INTO cached_queries (reporter_name, query_date, result_json)
+    VALUES (?, ?, {"jsonb(?)" if HAS_JSONB else "?"})
+"""
+_SELECT_SUMMARY = "SELECT summary FROM cached_summaries WHERE article_url = ?"
+_UPSERT_SUMMARY = """
+    INSERT OR REPLACE INTO cached_summaries (article_url, summary)
+    VALUES (?, ?)
+"""
+# URLs are bound as a single JSON array, so one compiled statement serves
+# every batch size
+_SELECT_SUMMARIES_BULK = """
+    SELECT article_url, summary FROM cached_summaries
+    WHERE article_url IN (SELECT value FROM json_each(?))
+"""
+
 
 def get_cached_query(reporter_name: str) -> Optional[List[dict]]:
     """Get cached query result if fresh (within TTL)."""
-    conn = get_connection()
-    cursor = conn.cursor()
-
     cutoff = datetime.now() - timedelta(hours=QUERY_CACHE_TTL_HOURS)
 
-    cursor.execute("""
-        SELECT result_json FROM cached_queries
-        WHERE reporter_name = ? AND created_at > ?
-        ORDER BY created_at DESC LIMIT 1
-    """, (reporter_name.lower(), cutoff.isoformat()))
-
-    row = cursor.fetchone()
-    conn.close()
+    with borrow() as conn:
+        cursor = conn.cursor()
+        cursor.execute(_SELECT_CACHED_QUERY, (reporter_name.lower(), cutoff.isoformat()))
+        row = cursor.fetchone()
 
     if row:
-        return json.loads(row["result_json"])
+        return orjson.loads(row["result_json"])
     return None
 
 
 def set_cached_query(reporter_name: str, articles: List[dict]):
     """Cache query result."""
-    conn = get_connection()
-    cursor = conn.cursor()
-
     today = date.today().isoformat()
-    result_json = json.dumps(articles)
+    result_json = orjson.dumps(articles)
+    if HAS_JSONB:
+        # jsonb() treats BLOB arguments as JSONB already, so bind text
+        result_json = result_json.decode()
 
-    cursor.execute("""
-        INSERT OR REPLACE INTO cached_queries (reporter_name, query_date, result_json)
-        VALUES (?, ?, ?)
-    """, (reporter_name.lower(), today, result_json))
-
-    conn.commit()
-    conn.close()
+    with borrow() as conn:
+        conn.execute(_UPSERT_CACHED_QUERY, (reporter_name.lower(), today, result_json))
+        conn.commit()
 
 
 def get_cached_summary(article_url: str) -> Optional[str]:
     """Get cached summary for an article URL."""
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        SELECT summary FROM cached_summaries WHERE article_url = ?
-    """, (article_url,))
-
-    row = cursor.fetchone()
-    conn.close()
+    with borrow() as conn:
+        cursor = conn.cursor()
+        cursor.execute(_SELECT_SUMMARY, (article_url,))
+        row = cursor.fetchone()
 
     if row:
         return row["summary"]
@@ -67,16 +76,9 @@ def get_cached_summary(article_url: str) -> Optional[str]:
 
 def set_cached_summary(article_url: str, summary: str):
     """Cache summary for an article URL."""
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        INSERT OR REPLACE INTO cached_summaries (article_url, summary)
-        VALUES (?, ?)
-    """, (article_url, summary))
-
-    conn.commit()
-    conn.close()
+    with borrow() as conn:
+        conn.execute(_UPSERT_SUMMARY, (article_url, summary))
+        conn.commit()
 
 
 def get_cached_summaries_bulk(article_urls: List[str]) -> Dict[str, str]:
@@ -84,17 +86,11 @@ def get_cached_summaries_bulk(article_urls: List[str]) -> Dict[str, str]:
     if not article_urls:
         return {}
 
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    placeholders = ",".join("?" * len(article_urls))
-    cursor.execute(f"""
-        SELECT article_url, summary FROM cached_summaries
-        WHERE article_url IN ({placeholders})
-    """, article_urls)
-
-    results = {row["article_url"]: row["summary"] for row in cursor.fetchall()}
-    conn.close()
+    payload = orjson.dumps(list(article_urls)).decode()
+    with borrow() as conn:
+        cursor = conn.cursor()
+        cursor.execute(_SELECT_SUMMARIES_BULK, (payload,))
+        results = {row["article_url"]: row["summary"] for row in cursor.fetchall()}
 
     return results
 
@@ -104,13 +100,6 @@ def set_cached_summaries_bulk(summaries: Dict[str, str]):
     if not summaries:
         return
 
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.executemany("""
-        INSERT OR REPLACE INTO cached_summaries (article_url, summary)
-        VALUES (?, ?)
-    """, list(summaries.items()))
-
-    conn.commit()
-    conn.close()
+    with borrow() as conn:
+        conn.executemany(_UPSERT_SUMMARY, list(summaries.items()))
+        conn.commit()
@@ -1,30 +1,159 @@
 """SQLite database connection and initialization."""
 
+import queue
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from .headlines import headline_key
 
 DATABASE_PATH = Path(__file__).parent.parent.parent / "madison_mentions.db"
 
+# Bump when init_db() gains new DDL or migrations
+SCHEMA_VERSION = 3
+
+# SQL expression turning an ISO date into articles.date_int (epoch days)
+DATE_INT_SQL = "CAST(strftime('%s', {}) AS INTEGER) / 86400"
+
+# SQLite 3.45+ can store JSON as its binary JSONB encoding
+HAS_JSONB = sqlite3.sqlite_version_info >= (3, 45, 0)
+
+# Maximum number of idle connections kept open for reuse
+POOL_SIZE = 8
+
+# Size of each connection's compiled-statement LRU (sqlite3 default is 128)
+CACHED_STATEMENTS = 256
+
+# Per-connection tuning. WAL itself is persistent and set once in init_db().
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",  # ~64 MB page cache
+    "PRAGMA mmap_size=268435456",  # 256 MB
+)
+
+
+def _is_memory_db() -> bool:
+    return str(DATABASE_PATH) == ":memory:"
+
 
 def get_connection() -> sqlite3.Connection:
-    """Get a database connection with row factory."""
-    conn = sqlite3.connect(DATABASE_PATH)
+    """Get a database connection with row factory and tuned PRAGMAs."""
+    conn = sqlite3.connect(
+        DATABASE_PATH,
+        check_same_thread=False,
+        cached_statements=CACHED_STATEMENTS,
+    )
     conn.row_factory = sqlite3.Row
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
     return conn
 
 
+# Idle connections, reused so PRAGMAs run once and the page cache stays warm
+_pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=POOL_SIZE)
+
+
+@contextmanager
+def borrow() -> Iterator[sqlite3.Connection]:
+    """Borrow a pooled connection, returning it to the pool afterwards.
+
+    Any transaction left open (e.g. after an exception) is rolled back
+    before the connection goes back into the pool.
+    """
+    try:
+        conn = _pool.get_nowait()
+    except queue.Empty:
+        conn = get_connection()
+
+    try:
+        yield conn
+    finally:
+        if conn.in_transaction:
+            conn.rollback()
+        try:
+            _pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+
+@contextmanager
+def maybe_borrow(conn: Optional[sqlite3.Connection] = None) -> Iterator[sqlite3.Connection]:
+    """Use a caller-owned connection as-is, or borrow one and commit on exit.
+
+    Lets data-access functions take an optional ``conn`` so callers can batch
+    several writes into one transaction; the caller then owns the commit.
+    """
+    if conn is not None:
+        yield conn
+        return
+    with borrow() as own:
+        yield own
+        own.commit()
+
+
+@contextmanager
+def transaction() -> Iterator[sqlite3.Connection]:
+    """Borrow a connection inside one write transaction, committed on clean exit.
+
+    BEGIN IMMEDIATE takes the write lock up front, so the block can't fail
+    halfway with SQLITE_BUSY on its first write; an exception rolls back.
+    """
+    with borrow() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        yield conn
+        conn.commit()
+
+
+def _schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def _add_missing_columns(cursor: sqlite3.Cursor, table: str, columns: Dict[str, str]) -> None:
+    """ALTER TABLE ADD COLUMN for each column the table doesn't have yet."""
+    existing = {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+    for column, decl in columns.items():
+        if column not in existing:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+
+
 def init_db():
-    """Initialize database tables."""
+    """Initialize database tables and apply migrations.
+
+    The schema version is recorded in PRAGMA user_version, so once a database
+    is current this is a single PRAGMA read rather than a round of DDL.
+    """
     conn = get_connection()
+    try:
+        if _schema_version(conn) >= SCHEMA_VERSION:
+            return
+        _create_schema(conn)
+    finally:
+        conn.close()
+
+
+def _create_schema(conn: sqlite3.Connection) -> None:
     cursor = conn.cursor()
 
+    # WAL lets readers proceed while a writer commits; the mode is stored
+    # in the database file, so it only needs to be set once.
+    if not _is_memory_db():
+        cursor.execute("PRAGMA journal_mode=WAL")
+
+    # Take the write lock, then re-check in case another worker got here first
+    cursor.execute("BEGIN IMMEDIATE")
+    if _schema_version(conn) >= SCHEMA_VERSION:
+        conn.rollback()
+        return
+
     # Cache for GDELT query results
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS cached_queries (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             reporter_name TEXT NOT NULL,
             query_date TEXT NOT NULL,
-            result_json TEXT NOT NULL,
+            result_json BLOB NOT NULL,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             UNIQUE(reporter_name, query_date)
         )
@@ -44,7 +173,7 @@ def init_db():
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS reporters (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT UNIQUE NOT NULL,
+            name TEXT NOT NULL COLLATE NOCASE UNIQUE,
             perigon_journalist_id TEXT,
             current_outlet TEXT,
             reporter_bio TEXT,
@@ -58,27 +187,13 @@ def init_db():
         )
     """)
 
-    # Migration: add source column to existing databases
-    try:
-        cursor.execute("ALTER TABLE reporters ADD COLUMN source TEXT DEFAULT 'perigon'")
-    except sqlite3.OperationalError:
-        pass  # Column already exists
-
-    # Migration: add relevance classification columns
-    try:
-        cursor.execute("ALTER TABLE reporters ADD COLUMN pro_services_relevant BOOLEAN DEFAULT NULL")
-    except sqlite3.OperationalError:
-        pass  # Column already exists
-
-    try:
-        cursor.execute("ALTER TABLE reporters ADD COLUMN relevance_rationale TEXT")
-    except sqlite3.OperationalError:
-        pass  # Column already exists
-
-    try:
-        cursor.execute("ALTER TABLE reporters ADD COLUMN relevance_evaluated_at TIMESTAMP")
-    except sqlite3.OperationalError:
-        pass  # Column already exists
+    # Migration: add columns introduced after the original reporters table
+    _add_missing_columns(cursor, "reporters", {
+        "source": "TEXT DEFAULT 'perigon'",
+        "pro_services_relevant": "BOOLEAN DEFAULT NULL",
+        "relevance_rationale": "TEXT",
+        "relevance_evaluated_at": "TIMESTAMP",
+    })
 
     # Articles linked to reporters
     cursor.execute("""
@@ -88,7 +203,9 @@ def init_db():
             headline TEXT,
             outlet TEXT,
             date TEXT,
+            date_int INTEGER,  -- days since the Unix epoch, for sorting
             url TEXT UNIQUE,
+            headline_key INTEGER,  -- headlines.headline_key(headline)
             summary TEXT,
             topics_json TEXT DEFAULT '[]',
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -96,14 +213,48 @@ def init_db():
         )
     """)
 
+    # Migration: integer day number alongside the ISO date text
+    _add_missing_columns(cursor, "articles", {"date_int": "INTEGER"})
+    cursor.execute(f"""
+        UPDATE articles SET date_int = {DATE_INT_SQL.format("date")}
+        WHERE date_int IS NULL AND date IS NOT NULL
+    """)
+
+    # Migration: normalized-headline hash, unique per reporter, so syndicated
+    # copies of a stored story are dropped at insert time. Existing duplicates
+    # keep their rows but only the earliest one gets a key.
+    _add_missing_columns(cursor, "articles", {"headline_key": "INTEGER"})
+    conn.create_function("headline_key", 1, headline_key, deterministic=True)
+    cursor.execute("UPDATE articles SET headline_key = headline_key(headline) WHERE headline_key IS NULL")
+    cursor.execute("""
+        UPDATE articles SET headline_key = NULL
+        WHERE headline_key IS NOT NULL AND id NOT IN (
+            SELECT MIN(id) FROM articles WHERE headline_key IS NOT NULL
+            GROUP BY reporter_id, headline_key
+        )
+    """)
+
     # Indexes for fast lookups
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_reporters_name ON reporters(name)")
+    # reporters.name and cached_summaries.article_url are served by the
+    # implicit indexes behind their UNIQUE constraints; a second index on
+    # reporters(name) only added write cost.
+    cursor.execute("DROP INDEX IF EXISTS idx_reporters_name")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_articles_reporter_id ON articles(reporter_id)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_articles_reporter_date ON articles(reporter_id, date)")
+    cursor.execute("DROP INDEX IF EXISTS idx_articles_reporter_date")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_articles_reporter_date_int ON articles(reporter_id, date_int)")
+    cursor.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_articles_reporter_headline_key
+        ON articles(reporter_id, headline_key) WHERE headline_key IS NOT NULL
+    """)
 
+    cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
     conn.commit()
-    conn.close()
 
 
-# Initialize on import
+# Initialize on import (a no-op once the schema is current)
 init_db()
+
+
+if __name__ == "__main__":
+    init_db()
+    print(f"Database at {DATABASE_PATH} is at schema version {SCHEMA_VERSION}")
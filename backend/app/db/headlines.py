@@ -0,0 +1,45 @@
+"""Headline normalization shared by syndication dedup and the articles table."""
+
+import hashlib
+import re
+from functools import lru_cache
+from typing import Optional
+
+
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+# The same character class as a str.translate deletion table, over ASCII
+# plus the typographic punctuation common in headlines (curly quotes,
+# dashes, ellipsis), so most headlines never reach the regex
+_NON_WORD_TABLE = str.maketrans("", "", "".join(
+    c for c in map(chr, [*range(128), *range(0x2010, 0x2028)])
+    if _NON_WORD_RE.match(c)
+))
+
+# Checked in order, so "live updates" wins over "live update"
+_HEADLINE_PREFIXES = ("live updates", "live update", "breaking", "update")
+
+
+@lru_cache(maxsize=16384)
+def normalize_headline(headline: str) -> str:
+    """Normalize headline for comparison."""
+    h = headline.lower().translate(_NON_WORD_TABLE)
+    if not h.isascii():
+        h = _NON_WORD_RE.sub('', h)
+    h = " ".join(h.split())
+    # One tuple startswith in C for the common case of no prefix at all
+    if h.startswith(_HEADLINE_PREFIXES):
+        prefix = next(p for p in _HEADLINE_PREFIXES if h.startswith(p))
+        h = h[len(prefix):].lstrip()
+    return h
+
+
+def headline_key(headline: Optional[str]) -> Optional[int]:
+    """64-bit hash of the normalized headline, stored as articles.headline_key.
+
+    None for headlines that normalize to nothing, so they never collide.
+    """
+    normalized = normalize_headline(headline or "")
+    if not normalized:
+        return None
+    digest = hashlib.blake2b(normalized.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)  # fits SQLite INTEGER
@@ -1,30 +1,83 @@
 """Data access layer for the reporters and articles tables."""
 
-import json
+import sqlite3
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
-from .database import get_connection
+import orjson
+
+from .database import DATE_INT_SQL, borrow, maybe_borrow
+from .headlines import headline_key
 
 
 FRESHNESS_WINDOW_DAYS = 7
 
+# Hot-path SQL kept as module constants so the statement cache hits on text
+_SELECT_REPORTER_BY_NAME = "SELECT * FROM reporters WHERE name = ?"
+_SELECT_REPORTER_ARTICLES = """
+    SELECT id, reporter_id, headline, outlet, date, url, summary, topics_json
+    FROM articles WHERE reporter_id = ? ORDER BY date_int DESC
+"""
+# Article columns come last so the reporter part of each row is r.*
+_SELECT_REPORTER_WITH_ARTICLES = """
+    SELECT r.*, a.id, a.reporter_id, a.headline, a.outlet, a.date, a.url, a.summary, a.topics_json
+    FROM reporters r
+    LEFT JOIN articles a ON a.reporter_id = r.id
+    WHERE r.name = ?
+    ORDER BY a.date_int DESC
+"""
+_ARTICLE_COLUMN_COUNT = 8
+_SELECT_EXISTING_NAMES = """
+    SELECT name FROM reporters WHERE name IN (SELECT value FROM json_each(?))
+"""
+_INSERT_ARTICLES_JSON = f"""
+    INSERT OR IGNORE INTO articles
+        (reporter_id, headline, outlet, date, date_int, url, headline_key, summary, topics_json)
+    SELECT
+        ?,
+        json_extract(value, '$.headline'),
+        json_extract(value, '$.outlet'),
+        json_extract(value, '$.date'),
+        {DATE_INT_SQL.format("json_extract(value, '$.date')")},
+        json_extract(value, '$.url'),
+        json_extract(value, '$.headline_key'),
+        json_extract(value, '$.summary'),
+        COALESCE(json_extract(value, '$.topics'), '[]')
+    FROM json_each(?)
+"""
+
+
+@lru_cache(maxsize=4096)
+def normalize_name(name: str) -> str:
+    """Canonical lookup key for a reporter name (trimmed, lowercase)."""
+    return name.strip().lower()
+
 
-def get_reporter(name: str) -> Optional[Dict]:
-    """Lookup reporter by lowercase-trimmed name. Returns dict or None."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        "SELECT * FROM reporters WHERE name = ?",
-        (name.strip().lower(),),
-    )
-    row = cursor.fetchone()
-    conn.close()
+def get_reporter_exact(name_key: str, conn: Optional[sqlite3.Connection] = None) -> Optional[Dict]:
+    """Lookup reporter by an already-normalized name (see normalize_name)."""
+    with maybe_borrow(conn) as conn:
+        cursor = conn.cursor()
+        cursor.execute(_SELECT_REPORTER_BY_NAME, (name_key,))
+        row = cursor.fetchone()
     if row:
         return dict(row)
     return None
 
 
+def get_existing_reporter_names(names: Iterable[str]) -> Set[str]:
+    """Return the subset of names (lowercase-trimmed) that already exist."""
+    normalized = list({normalize_name(n) for n in names})
+    if not normalized:
+        return set()
+
+    # Bound as one JSON array: no parameter limit, one cached statement
+    with borrow() as conn:
+        cursor = conn.cursor()
+        cursor.execute(_SELECT_EXISTING_NAMES, (orjson.dumps(normalized).decode(),))
+        return {row["name"] for row in cursor.fetchall()}
+
+
 def is_reporter_fresh(reporter: Dict) -> bool:
     """Check if reporter record is within the freshness window."""
     last_updated = reporter.get("last_updated")
@@ -35,41 +88,64 @@ def is_reporter_fresh(reporter: Dict) -> bool:
     return datetime.now() - last_updated < timedelta(days=FRESHNESS_WINDOW_DAYS)
 
 
-def get_reporter_articles(reporter_id: int) -> List[Dict]:
+def get_reporter_articles(
+    reporter_id: int, conn: Optional[sqlite3.Connection] = None
+) -> List[Dict]:
     """Return all articles for a reporter, sorted by date DESC, with parsed topics."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        "SELECT * FROM articles WHERE reporter_id = ? ORDER BY date DESC",
-        (reporter_id,),
-    )
-    rows = cursor.fetchall()
-    conn.close()
-
-    articles = []
-    for row in rows:
-        article = dict(row)
-        try:
-            article["topics"] = json.loads(article.get("topics_json") or "[]")
-        except (json.JSONDecodeError, TypeError):
-            article["topics"] = []
-        articles.append(article)
-    return articles
-
-
-def get_latest_article_date(reporter_id: int) -> Optional[str]:
-    """Return the most recent article date for a reporter, or None."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        "SELECT MAX(date) as max_date FROM articles WHERE reporter_id = ?",
-        (reporter_id,),
-    )
-    row = cursor.fetchone()
-    conn.close()
-    if row and row["max_date"]:
-        return row["max_date"]
-    return None
+    with maybe_borrow(conn) as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = None  # plain tuples, unpacked positionally below
+        cursor.execute(_SELECT_REPORTER_ARTICLES, (reporter_id,))
+        rows = cursor.fetchall()
+
+    return [_article_from_row(row) for row in rows]
+
+
+def get_reporter_with_articles(name: str) -> Tuple[Optional[Dict], List[Dict]]:
+    """Fetch a reporter and their articles (date DESC) in a single query.
+
+    Returns (None, []) if the reporter doesn't exist.
+    """
+    with borrow() as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(_SELECT_REPORTER_WITH_ARTICLES, (normalize_name(name),))
+        rows = cursor.fetchall()
+        columns = [d[0] for d in cursor.description]
+
+    if not rows:
+        return None, []
+
+    split = len(columns) - _ARTICLE_COLUMN_COUNT
+    reporter = dict(zip(columns[:split], rows[0][:split]))
+    # LEFT JOIN yields a single all-NULL article part when there are none
+    articles = [_article_from_row(row[split:]) for row in rows if row[split] is not None]
+    return reporter, articles
+
+
+def _article_from_row(row: tuple) -> Dict:
+    """Article dict from (id, reporter_id, headline, outlet, date, url, summary, topics_json)."""
+    article_id, owner_id, headline, outlet, article_date, url, summary, topics_json = row
+    return {
+        "id": article_id,
+        "reporter_id": owner_id,
+        "headline": headline,
+        "outlet": outlet,
+        "date": article_date,
+        "url": url,
+        "summary": summary,
+        "topics": _parse_topics(topics_json),
+    }
+
+
+def _parse_topics(topics_json: Optional[str]) -> List[str]:
+    """Decode a stored topics_json value, treating bad data as no topics."""
+    if not topics_json:
+        return []
+    try:
+        return orjson.loads(topics_json)
+    except orjson.JSONDecodeError:
+        return []
 
 
 def upsert_reporter(
@@ -79,74 +155,69 @@ def upsert_reporter(
     current_outlet: Optional[str] = None,
     bio: Optional[str] = None,
     source: Optional[str] = None,
+    conn: Optional[sqlite3.Connection] = None,
 ) -> int:
-    """Insert or update a reporter record. Returns the reporter id."""
-    conn = get_connection()
-    cursor = conn.cursor()
+    """Insert or update a reporter record. Returns the reporter id.
+
+    With a caller-owned ``conn`` the write is left for the caller to commit.
+    """
     now = datetime.now().isoformat()
-    social_json = json.dumps(social_links) if social_links else None
-
-    cursor.execute(
-        """
-        INSERT INTO reporters (name, perigon_journalist_id, social_links_json, current_outlet, reporter_bio, source, last_updated)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT(name) DO UPDATE SET
-            perigon_journalist_id = COALESCE(excluded.perigon_journalist_id, perigon_journalist_id),
-            social_links_json = COALESCE(excluded.social_links_json, social_links_json),
-            current_outlet = COALESCE(excluded.current_outlet, current_outlet),
-            reporter_bio = COALESCE(excluded.reporter_bio, reporter_bio),
-            source = COALESCE(excluded.source, source),
-            last_updated = excluded.last_updated
-        """,
-        (name.strip().lower(), perigon_id, social_json, current_outlet, bio, source, now),
-    )
-    reporter_id = cursor.lastrowid
-
-    # If ON CONFLICT triggered, lastrowid may be 0; fetch the actual id
-    if not reporter_id:
-        cursor.execute("SELECT id FROM reporters WHERE name = ?", (name.strip().lower(),))
-        reporter_id = cursor.fetchone()["id"]
-
-    conn.commit()
-    conn.close()
+    social_json = orjson.dumps(social_links).decode() if social_links else None
+
+    with maybe_borrow(conn) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            INSERT INTO reporters (name, perigon_journalist_id, social_links_json, current_outlet, reporter_bio, source, last_updated)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(name) DO UPDATE SET
+                perigon_journalist_id = COALESCE(excluded.perigon_journalist_id, perigon_journalist_id),
+                social_links_json = COALESCE(excluded.social_links_json, social_links_json),
+                current_outlet = COALESCE(excluded.current_outlet, current_outlet),
+                reporter_bio = COALESCE(excluded.reporter_bio, reporter_bio),
+                source = COALESCE(excluded.source, source),
+                last_updated = excluded.last_updated
+            RETURNING id
+            """,
+            (normalize_name(name), perigon_id, social_json, current_outlet, bio, source, now),
+        )
+        reporter_id = cursor.fetchone()[0]
     return reporter_id
 
 
-def insert_articles(reporter_id: int, articles: List[Dict]) -> int:
-    """Insert articles, skipping duplicates by URL. Returns count of new inserts."""
+def insert_articles(
+    reporter_id: int,
+    articles: List[Dict],
+    conn: Optional[sqlite3.Connection] = None,
+) -> int:
+    """Insert articles, skipping duplicates by URL. Returns count of new inserts.
+
+    Articles whose normalized headline the reporter already has (syndicated
+    copies) are skipped too, via the unique index on headline_key.
+
+    The whole batch is bound as one JSON array and expanded in SQL with
+    json_each, so the insert is a single statement regardless of size.
+    """
     if not articles:
         return 0
 
-    conn = get_connection()
-    cursor = conn.cursor()
-    inserted = 0
-
-    for a in articles:
-        topics_json = json.dumps(a.get("topics", []))
-        try:
-            cursor.execute(
-                """
-                INSERT OR IGNORE INTO articles
-                    (reporter_id, headline, outlet, date, url, summary, topics_json)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    reporter_id,
-                    a.get("headline"),
-                    a.get("outlet"),
-                    a.get("date"),
-                    a.get("url"),
-                    a.get("summary"),
-                    topics_json,
-                ),
-            )
-            if cursor.rowcount > 0:
-                inserted += 1
-        except Exception:
-            continue
-
-    conn.commit()
-    conn.close()
+    payload = orjson.dumps([
+        {
+            "headline": a.get("headline"),
+            "outlet": a.get("outlet"),
+            "date": a.get("date"),
+            "url": a.get("url"),
+            "headline_key": headline_key(a.get("headline")),
+            "summary": a.get("summary"),
+            "topics": a.get("topics", []),
+        }
+        for a in articles
+    ]).decode()
+
+    with maybe_borrow(conn) as conn:
+        cursor = conn.cursor()
+        cursor.execute(_INSERT_ARTICLES_JSON, (reporter_id, payload))
+        inserted = cursor.rowcount
     return inserted
 
 
@@ -154,63 +225,63 @@ def update_reporter_profile(
     reporter_id: int,
     current_outlet: Optional[str] = None,
     bio: Optional[str] = None,
-) -> None:
-    """Update the profile fields and touch last_updated."""
-    conn = get_connection()
-    cursor = conn.cursor()
+    conn: Optional[sqlite3.Connection] = None,
+) -> str:
+    """Update the profile fields and touch last_updated. Returns the new last_updated."""
     now = datetime.now().isoformat()
-    cursor.execute(
-        """
-        UPDATE reporters
-        SET current_outlet = ?, reporter_bio = ?, last_updated = ?
-        WHERE id = ?
-        """,
-        (current_outlet, bio, now, reporter_id),
-    )
-    conn.commit()
-    conn.close()
-
-
-def update_relevance(reporter_id: int, relevant: bool, rationale: str) -> None:
+    with maybe_borrow(conn) as conn:
+        conn.execute(
+            """
+            UPDATE reporters
+            SET current_outlet = ?, reporter_bio = ?, last_updated = ?
+            WHERE id = ?
+            """,
+            (current_outlet, bio, now, reporter_id),
+        )
+    return now
+
+
+def update_relevance(
+    reporter_id: int,
+    relevant: bool,
+    rationale: str,
+    conn: Optional[sqlite3.Connection] = None,
+) -> None:
     """Store relevance classification. Does NOT touch last_updated."""
-    conn = get_connection()
-    cursor = conn.cursor()
     now = datetime.now().isoformat()
-    cursor.execute(
-        """
-        UPDATE reporters
-        SET pro_services_relevant = ?, relevance_rationale = ?, relevance_evaluated_at = ?
-        WHERE id = ?
-        """,
-        (relevant, rationale, now, reporter_id),
-    )
-    conn.commit()
-    conn.close()
+    with maybe_borrow(conn) as conn:
+        conn.execute(
+            """
+            UPDATE reporters
+            SET pro_services_relevant = ?, relevance_rationale = ?, relevance_evaluated_at = ?
+            WHERE id = ?
+            """,
+            (relevant, rationale, now, reporter_id),
+        )
 
 
 def get_relevance(reporter_id: int) -> Optional[Dict]:
     """Return relevance classification for a reporter, or None if not yet evaluated."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        "SELECT pro_services_relevant, relevance_rationale, relevance_evaluated_at FROM reporters WHERE id = ?",
-        (reporter_id,),
-    )
-    row = cursor.fetchone()
-    conn.close()
+    with borrow() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT pro_services_relevant, relevance_rationale, relevance_evaluated_at FROM reporters WHERE id = ?",
+            (reporter_id,),
+        )
+        row = cursor.fetchone()
     if row and row["pro_services_relevant"] is not None:
         return dict(row)
     return None
 
 
-def update_reporter_timestamp(reporter_id: int) -> None:
+def update_reporter_timestamp(
+    reporter_id: int,
+    conn: Optional[sqlite3.Connection] = None,
+) -> None:
     """Touch last_updated without changing other fields."""
-    conn = get_connection()
-    cursor = conn.cursor()
     now = datetime.now().isoformat()
-    cursor.execute(
-        "UPDATE reporters SET last_updated = ? WHERE id = ?",
-        (now, reporter_id),
-    )
-    conn.commit()
-    conn.close()
+    with maybe_borrow(conn) as conn:
+        conn.execute(
+            "UPDATE reporters SET last_updated = ? WHERE id = ?",
+            (now, reporter_id),
+        )
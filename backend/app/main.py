@@ -3,44 +3,63 @@
 FastAPI application entry point.
 """
 
+from contextlib import asynccontextmanager
 from pathlib import Path
-from fastapi import FastAPI
+
+from dotenv import load_dotenv
+from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+
+# Read .env once for the whole app; the services only look up their API
+# keys when first called
+load_dotenv()
 
 from .routers import reporters, csv_import
+from .services import csv_analyzer, perigon, relevance_classifier, summarizer
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release the pooled Perigon and Anthropic connections
+    await perigon.close_client()
+    await summarizer.close_async_client()
+    summarizer.close_client()
+    relevance_classifier.close_client()
+    csv_analyzer.close_client()
 
 
 app = FastAPI(
     title="Madison Mentions",
     description="Reporter intelligence tool for PR professionals",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Include API routes
 app.include_router(reporters.router)
 app.include_router(csv_import.router)
 
-# Serve frontend static files
+# Serve frontend static files. Mounted last so the /api routes take
+# precedence; StaticFiles answers conditional requests with 304s.
 frontend_path = Path(__file__).parent.parent.parent / "frontend"
 
-
-@app.get("/")
-async def serve_index():
-    """Serve the main frontend page."""
-    return FileResponse(frontend_path / "index.html")
+# Assets are versioned via query string in index.html (?v=N)
+STATIC_CACHE_CONTROL = "public, max-age=3600"
+STATIC_CACHE_SUFFIXES = (".css", ".js")
 
 
-@app.get("/styles.css")
-async def serve_styles():
-    """Serve CSS file."""
-    return FileResponse(frontend_path / "styles.css", media_type="text/css")
+@app.middleware("http")
+async def add_static_cache_headers(request: Request, call_next):
+    """Let browsers cache CSS/JS instead of revalidating on every load."""
+    response = await call_next(request)
+    path = request.url.path
+    if path.endswith(STATIC_CACHE_SUFFIXES) and not path.startswith("/api/"):
+        response.headers.setdefault("Cache-Control", STATIC_CACHE_CONTROL)
+    return response
 
 
-@app.get("/app.js")
-async def serve_js():
-    """Serve JavaScript file."""
-    return FileResponse(frontend_path / "app.js", media_type="application/javascript")
+app.mount("/", StaticFiles(directory=frontend_path, html=True), name="frontend")
 
 
 if __name__ == "__main__":
@@ -2,11 +2,13 @@
 
 from datetime import date, datetime
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Article(BaseModel):
     """A single article by a reporter."""
+    model_config = ConfigDict(frozen=True)
+
     headline: str
     outlet: str
     date: date
@@ -18,6 +20,8 @@ class Article(BaseModel):
 
 class SocialLinks(BaseModel):
     """Social media and professional links for a reporter."""
+    model_config = ConfigDict(frozen=True)
+
     twitter_handle: Optional[str] = None
     twitter_url: Optional[str] = None
     linkedin_url: Optional[str] = None
@@ -27,6 +31,8 @@ class SocialLinks(BaseModel):
 
 class ReporterDossier(BaseModel):
     """Complete dossier for a reporter."""
+    model_config = ConfigDict(frozen=True)
+
     reporter_name: str
     query_date: date
     articles: List[Article]
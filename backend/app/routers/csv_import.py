@@ -1,16 +1,25 @@
 """CSV import endpoints — upload, AI analysis, and confirm import."""
 
+import asyncio
 import csv
 import io
 import logging
+import re
 import time
 import uuid
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, HTTPException, UploadFile
 from pydantic import BaseModel
 
-from ..db.reporter_store import get_reporter, upsert_reporter
+from ..db.database import transaction
+from ..db.reporter_store import (
+    get_existing_reporter_names,
+    get_reporter_exact,
+    normalize_name,
+    upsert_reporter,
+)
 from ..services.csv_analyzer import analyze_csv_with_claude
 
 
@@ -18,29 +27,65 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["import"])
 
-# In-memory store for pending imports (session_id -> data)
-_pending_imports: Dict[str, dict] = {}
-
 MAX_FILE_SIZE = 2 * 1024 * 1024  # 2 MB
 MAX_ROWS = 5000
 SESSION_TTL_SECONDS = 30 * 60  # 30 minutes
 MAX_PENDING_SESSIONS = 20
 
+# Handle from a twitter.com / x.com profile URL (path segment after the host)
+_TWITTER_URL_RE = re.compile(r"(?<![\w-])(?:twitter\.com|x\.com)/@?([^/?#]+)")
+
+
+class PendingStore:
+    """Size- and TTL-bounded store for pending imports (session_id -> data).
+
+    Entries are kept in insertion order, so the oldest session is always at
+    the front: expiry and the size cap both evict from the head in O(1).
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+
+    def __setitem__(self, session_id: str, data: dict) -> None:
+        self._entries[session_id] = (time.monotonic(), data)
+        self._entries.move_to_end(session_id)
+        self._evict()
+
+    def pop(self, session_id: str) -> Optional[dict]:
+        """Remove and return a session's data, or None if missing/expired."""
+        self._evict()
+        entry = self._entries.pop(session_id, None)
+        return entry[1] if entry else None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self) -> None:
+        """Drop expired sessions, then the oldest ones beyond the size cap."""
+        cutoff = time.monotonic() - self._ttl
+        while self._entries:
+            created_at, _ = next(iter(self._entries.values()))
+            if created_at > cutoff and len(self._entries) <= self._max_size:
+                break
+            self._entries.popitem(last=False)
+
+
+# In-memory store for pending imports
+_pending_imports = PendingStore(MAX_PENDING_SESSIONS, SESSION_TTL_SECONDS)
+
+
+def _column_index(headers: List[str]) -> Dict[str, int]:
+    """Map each header to its column position (last one wins on duplicates)."""
+    return {h: i for i, h in enumerate(headers)}
 
-def _evict_stale_sessions():
-    """Remove expired sessions to prevent memory leaks."""
-    now = time.time()
-    expired = [
-        sid for sid, data in _pending_imports.items()
-        if now - data.get("created_at", 0) > SESSION_TTL_SECONDS
-    ]
-    for sid in expired:
-        del _pending_imports[sid]
-    # Hard cap: if still over limit, remove oldest
-    if len(_pending_imports) > MAX_PENDING_SESSIONS:
-        by_age = sorted(_pending_imports.items(), key=lambda x: x[1].get("created_at", 0))
-        for sid, _ in by_age[:len(_pending_imports) - MAX_PENDING_SESSIONS]:
-            del _pending_imports[sid]
+
+def _cell(row: List[str], index: Optional[int]) -> str:
+    """Value at a column index, or "" for unmapped columns and short rows."""
+    if index is None or index >= len(row):
+        return ""
+    return row[index]
 
 
 class ConfirmRequest(BaseModel):
@@ -76,142 +121,175 @@ async def analyze_csv(file: UploadFile):
     if text is None:
         raise HTTPException(status_code=400, detail="Could not decode file — unsupported encoding")
 
-    # Parse CSV
-    reader = csv.DictReader(io.StringIO(text))
-    headers = reader.fieldnames
+    # Parse CSV as plain row lists; columns are looked up by index
+    reader = csv.reader(io.StringIO(text))
+    headers = next(reader, None)
     if not headers:
         raise HTTPException(status_code=400, detail="CSV has no headers")
 
     rows = []
-    for i, row in enumerate(reader):
-        if i >= MAX_ROWS:
+    for row in reader:
+        if not row:
+            continue  # blank line
+        if len(rows) >= MAX_ROWS:
             break
         rows.append(row)
 
     if not rows:
         raise HTTPException(status_code=400, detail="CSV has no data rows")
 
+    column_index = _column_index(headers)
+
     # Prepare sample rows as lists (matching header order)
     sample_rows = [
-        [row.get(h, "") for h in headers] for row in rows[:10]
+        [_cell(row, i) for i in range(len(headers))] for row in rows[:10]
     ]
 
-    # AI analysis
-    analysis = analyze_csv_with_claude(headers, sample_rows)
+    # AI analysis (a blocking API call, so in a worker thread)
+    analysis = await asyncio.to_thread(analyze_csv_with_claude, headers, sample_rows)
 
     # Detect duplicates by checking names against existing reporters
     duplicates = []
     name_col = None
     if analysis.get("column_mapping"):
         name_col = analysis["column_mapping"].get("name")
-    if name_col:
-        seen_names = set()
+    if name_col in column_index:
+        name_idx = column_index[name_col]
+        # First spelling of each distinct name (keyed by normalized name)
+        unique_names = {}
         for row in rows:
-            name_val = (row.get(name_col) or "").strip()
-            if name_val and name_val.lower() not in seen_names:
-                seen_names.add(name_val.lower())
-                existing = get_reporter(name_val)
-                if existing:
-                    duplicates.append(name_val)
-
-    # Store pending import (evict stale sessions first)
-    _evict_stale_sessions()
+            name_val = _cell(row, name_idx).strip()
+            if name_val:
+                unique_names.setdefault(normalize_name(name_val), name_val)
+        existing = await asyncio.to_thread(get_existing_reporter_names, unique_names)
+        duplicates = [
+            name_val for lower, name_val in unique_names.items() if lower in existing
+        ]
+
+    # Store pending import (stale sessions are evicted by the store)
     session_id = str(uuid.uuid4())
     _pending_imports[session_id] = {
         "rows": rows,
-        "headers": list(headers),
+        "headers": headers,
         "analysis": analysis,
         "filename": file.filename,
-        "created_at": time.time(),
     }
 
     return {
         "session_id": session_id,
         "filename": file.filename,
         "total_rows": len(rows),
-        "headers": list(headers),
-        "sample_rows": [dict(row) for row in rows[:5]],
+        "headers": headers,
+        # From the padded samples, so short rows still carry every header
+        "sample_rows": [dict(zip(headers, row)) for row in sample_rows[:5]],
         "analysis": analysis,
         "duplicates": duplicates,
     }
 
 
-@router.post("/import/confirm")
-async def confirm_import(request: ConfirmRequest):
-    """Apply column mapping and import reporters into the database."""
-    pending = _pending_imports.pop(request.session_id, None)
-    if not pending:
-        raise HTTPException(
-            status_code=404,
-            detail="Import session not found or expired. Please re-upload the file."
-        )
+def _import_rows(
+    headers: List[str],
+    rows: List[List[str]],
+    mapping: Dict[str, Optional[str]],
+    skip_duplicates: bool,
+) -> Tuple[int, int, int]:
+    """Import mapped rows in one transaction.
 
-    mapping = request.column_mapping
-    name_col = mapping.get("name")
-    if not name_col:
-        raise HTTPException(status_code=400, detail="Name column mapping is required")
-
-    outlet_col = mapping.get("outlet")
-    bio_col = mapping.get("bio")
-    twitter_col = mapping.get("twitter")
-    linkedin_col = mapping.get("linkedin")
+    Returns (imported, skipped, errors).
+    """
+    column_index = _column_index(headers)
+    name_idx = column_index.get(mapping["name"])
+    outlet_idx = column_index.get(mapping.get("outlet"))
+    bio_idx = column_index.get(mapping.get("bio"))
+    twitter_idx = column_index.get(mapping.get("twitter"))
+    linkedin_idx = column_index.get(mapping.get("linkedin"))
 
     imported = 0
     skipped = 0
     errors = 0
 
-    for row in pending["rows"]:
-        row_name = (row.get(name_col) or "").strip()
-        try:
-            if not row_name:
-                skipped += 1
-                continue
-
-            # Skip duplicates if requested
-            if request.skip_duplicates:
-                existing = get_reporter(row_name)
-                if existing:
+    # One connection and one transaction (a single commit) for the whole file
+    with transaction() as conn:
+        for row in rows:
+            row_name = _cell(row, name_idx).strip()
+            try:
+                if not row_name:
                     skipped += 1
                     continue
 
-            outlet = (row.get(outlet_col) or "").strip() if outlet_col else None
-            bio = (row.get(bio_col) or "").strip() if bio_col else None
+                # Skip duplicates if requested
+                if skip_duplicates:
+                    existing = get_reporter_exact(normalize_name(row_name), conn=conn)
+                    if existing:
+                        skipped += 1
+                        continue
+
+                outlet = _cell(row, outlet_idx).strip()
+                bio = _cell(row, bio_idx).strip()
 
-            # Build social links
-            social_links = {}
-            if twitter_col:
-                twitter_val = (row.get(twitter_col) or "").strip()
+                # Build social links
+                social_links = {}
+                twitter_val = _cell(row, twitter_idx).strip()
                 if twitter_val:
-                    handle = twitter_val.lstrip("@")
                     # If it's already a URL, extract handle
-                    if "twitter.com/" in handle or "x.com/" in handle:
+                    match = _TWITTER_URL_RE.search(twitter_val)
+                    if match:
                         social_links["twitter_url"] = twitter_val
-                        handle = handle.split("/")[-1].split("?")[0]
+                        handle = match.group(1)
                     else:
+                        handle = twitter_val.lstrip("@")
                         social_links["twitter_url"] = f"https://twitter.com/{handle}"
                     social_links["twitter_handle"] = handle
 
-            if linkedin_col:
-                linkedin_val = (row.get(linkedin_col) or "").strip()
+                linkedin_val = _cell(row, linkedin_idx).strip()
                 if linkedin_val:
                     if linkedin_val.startswith("http"):
                         social_links["linkedin_url"] = linkedin_val
                     else:
                         social_links["linkedin_url"] = f"https://linkedin.com/in/{linkedin_val}"
 
-            upsert_reporter(
-                name=row_name,
-                social_links=social_links if social_links else None,
-                current_outlet=outlet or None,
-                bio=bio or None,
-                source="csv_import",
-            )
-            imported += 1
-
-        except Exception:
-            logger.exception("Failed to import reporter: %s", row_name)
-            errors += 1
-            continue
+                upsert_reporter(
+                    name=row_name,
+                    social_links=social_links if social_links else None,
+                    current_outlet=outlet or None,
+                    bio=bio or None,
+                    source="csv_import",
+                    conn=conn,
+                )
+                imported += 1
+
+            except Exception:
+                logger.exception("Failed to import reporter: %s", row_name)
+                errors += 1
+                continue
+
+    return imported, skipped, errors
+
+
+@router.post("/import/confirm")
+async def confirm_import(request: ConfirmRequest):
+    """Apply column mapping and import reporters into the database."""
+    pending = _pending_imports.pop(request.session_id)
+    if not pending:
+        raise HTTPException(
+            status_code=404,
+            detail="Import session not found or expired. Please re-upload the file."
+        )
+
+    mapping = request.column_mapping
+    name_col = mapping.get("name")
+    if not name_col:
+        raise HTTPException(status_code=400, detail="Name column mapping is required")
+
+    # The whole file is one write transaction; run it in a worker thread
+    # so the event loop isn't blocked for the length of the import
+    imported, skipped, errors = await asyncio.to_thread(
+        _import_rows,
+        pending["headers"],
+        pending["rows"],
+        mapping,
+        request.skip_duplicates,
+    )
 
     return {
         "imported": imported,
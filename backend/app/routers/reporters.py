@@ -1,17 +1,25 @@
 """Reporter dossier API endpoint with cache-first architecture."""
 
-import json
-import re
-from datetime import date, datetime, timedelta
-from typing import List, Optional
-
-from fastapi import APIRouter, HTTPException
-
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
+
+import orjson
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, Response
+
+from ..db.database import transaction
+from ..db.headlines import normalize_headline
 from ..db.reporter_store import (
-    get_reporter,
+    get_reporter_with_articles,
+    normalize_name,
     is_reporter_fresh,
     get_reporter_articles,
-    get_latest_article_date,
     upsert_reporter,
     insert_articles,
     update_reporter_profile,
@@ -19,113 +27,84 @@ from ..db.reporter_store import (
     get_relevance,
 )
 from ..models.schemas import Article, ReporterDossier, SocialLinks
-from ..services.perigon import search_and_get_journalist, fetch_articles_since
+from ..services.perigon import (
+    PerigonUnavailable,
+    fetch_articles_since,
+    search_journalist_with_articles,
+)
 from ..services.summarizer import summarize_headlines, generate_reporter_profile
 from ..services.analyzer import detect_outlet_change
+from ..services.dedup import deduplicate_by_headline
 from ..services.relevance_classifier import classify_reporter
 
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api", tags=["reporters"])
 
-# Outlet priority for deduplication (higher = preferred)
-OUTLET_PRIORITY = {
-    "New York Times": 100,
-    "Wall Street Journal": 100,
-    "Washington Post": 100,
-    "Bloomberg": 95,
-    "Reuters": 95,
-    "AP News": 95,
-    "Politico": 90,
-    "The Atlantic": 90,
-    "Axios": 85,
-    "CNN": 80,
-    "NBC News": 80,
-    "CBS News": 80,
-    "ABC News": 80,
-    "NPR": 80,
-    "Los Angeles Times": 75,
-    "Chicago Tribune": 75,
-    "Boston Globe": 75,
-    "Seattle Times": 70,
-    "Miami Herald": 70,
-    "SF Chronicle": 70,
-}
-
-
-def normalize_headline(headline: str) -> str:
-    """Normalize headline for comparison."""
-    h = headline.lower()
-    h = re.sub(r'[^\w\s]', '', h)
-    h = re.sub(r'\s+', ' ', h).strip()
-    h = re.sub(r'^(live updates?|breaking|update)\s*:?\s*', '', h)
-    return h
-
-
-def deduplicate_by_headline(articles: list) -> list:
-    """Remove duplicate syndicated articles, keeping the primary outlet version."""
-    headline_groups = {}
-    for article in articles:
-        key = normalize_headline(article.get("headline", ""))
-        if not key:
-            continue
-        if key not in headline_groups:
-            headline_groups[key] = []
-        headline_groups[key].append(article)
-
-    unique = []
-    for key, group in headline_groups.items():
-        if len(group) == 1:
-            unique.append(group[0])
-        else:
-            group.sort(
-                key=lambda a: (
-                    OUTLET_PRIORITY.get(a.get("outlet", ""), 0),
-                    a.get("date", "")
-                ),
-                reverse=True
-            )
-            unique.append(group[0])
-
-    unique.sort(key=lambda a: a.get("date", ""), reverse=True)
-    return unique
-
-
-def build_dossier_from_db(reporter: dict) -> ReporterDossier:
-    """Build a ReporterDossier from a stored reporter record and its articles."""
-    reporter_id = reporter["id"]
-    db_articles = get_reporter_articles(reporter_id)
-
-    # Convert DB rows to dicts suitable for detect_outlet_change
-    articles_for_analysis = [
-        {
-            "headline": a["headline"],
-            "outlet": a["outlet"],
-            "date": a["date"],
-            "url": a["url"],
-            "summary": a.get("summary"),
-            "topics": a.get("topics", []),
-        }
-        for a in db_articles
-    ]
+# Built dossiers are reused for this long before going back to the DB
+DOSSIER_CACHE_TTL_SECONDS = 60
+DOSSIER_CACHE_MAX_SIZE = 1024
+# Empty dossiers (Perigon has no such journalist, or no articles by them)
+# aren't backed by the DB, so they're remembered separately and for longer;
+# until then every lookup would go back to Perigon
+EMPTY_DOSSIER_CACHE_TTL_SECONDS = 15 * 60
 
-    # Parse social links
-    social_links = None
+
+@lru_cache(maxsize=4096)
+def _parse_iso_date(value: str) -> Optional[date]:
+    """Memoized date.fromisoformat; articles from one fetch share few dates."""
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _parse_date(value) -> Optional[date]:
+    """Article date from a date or ISO string; None if missing or malformed."""
+    if isinstance(value, date):
+        return value
+    if not value or not isinstance(value, str):
+        return None
+    return _parse_iso_date(value)
+
+
+def _parse_social_links(reporter: dict) -> dict:
+    """Decode a reporter's social_links_json, treating missing/bad data as empty."""
     social_links_json = reporter.get("social_links_json")
-    if social_links_json:
-        try:
-            sl = json.loads(social_links_json)
-            social_links = SocialLinks(
-                twitter_handle=sl.get("twitter_handle"),
-                twitter_url=sl.get("twitter_url"),
-                linkedin_url=sl.get("linkedin_url"),
-                website_url=sl.get("website_url"),
-                title=sl.get("title"),
-            )
-        except (json.JSONDecodeError, TypeError):
-            pass
+    if not social_links_json:
+        return {}
+    try:
+        sl = orjson.loads(social_links_json)
+    except (orjson.JSONDecodeError, TypeError):
+        return {}
+    return sl if isinstance(sl, dict) else {}
+
+
+def build_dossier_from_db(
+    reporter: dict, db_articles: List[dict], social_links: Optional[dict] = None
+) -> ReporterDossier:
+    """Build a ReporterDossier from a stored reporter record and its articles.
+
+    db_articles must be newest first, as the store returns them; the order
+    is kept as-is. The rows are read in place, not copied. Pass social_links
+    if the caller has already parsed social_links_json.
+    """
+
+    # Parse social links
+    sl = _parse_social_links(reporter) if social_links is None else social_links
+    social_links_model = None
+    if sl:
+        social_links_model = SocialLinks(
+            twitter_handle=sl.get("twitter_handle"),
+            twitter_url=sl.get("twitter_url"),
+            linkedin_url=sl.get("linkedin_url"),
+            website_url=sl.get("website_url"),
+            title=sl.get("title"),
+        )
 
     # Detect outlet changes
-    change_detected, change_note = detect_outlet_change(articles_for_analysis)
+    change_detected, change_note = detect_outlet_change(db_articles)
 
     # Parse last_updated
     last_updated = None
@@ -135,26 +114,22 @@ def build_dossier_from_db(reporter: dict) -> ReporterDossier:
         except (ValueError, TypeError):
             pass
 
-    # Build article models (skip articles with missing dates)
+    # Build article models (skip articles with missing dates). The rows come
+    # from our own DB, so model_construct skips per-article validation, and
+    # are already ordered by date_int, so they need no re-sort.
     article_models = []
-    for a in articles_for_analysis:
-        article_date = a.get("date")
-        if not article_date:
+    for a in db_articles:
+        article_date = _parse_date(a.get("date"))
+        if article_date is None:
             continue
-        if not isinstance(article_date, date):
-            try:
-                article_date = date.fromisoformat(article_date)
-            except (ValueError, TypeError):
-                continue
-        article_models.append(Article(
+        article_models.append(Article.model_construct(
             headline=a["headline"],
             outlet=a["outlet"],
             date=article_date,
             url=a["url"],
             summary=a.get("summary"),
-            topics=a.get("topics", []),
+            topics=a.get("topics") or [],
         ))
-    article_models.sort(key=lambda a: a.date, reverse=True)
 
     return ReporterDossier(
         reporter_name=reporter["name"].title(),
@@ -162,7 +137,7 @@ def build_dossier_from_db(reporter: dict) -> ReporterDossier:
         articles=article_models,
         current_outlet=reporter.get("current_outlet"),
         reporter_bio=reporter.get("reporter_bio"),
-        social_links=social_links,
+        social_links=social_links_model,
         outlet_change_detected=change_detected,
         outlet_change_note=change_note,
         last_updated=last_updated,
@@ -171,79 +146,372 @@ def build_dossier_from_db(reporter: dict) -> ReporterDossier:
     )
 
 
-def _classify_if_needed(reporter_id: int, reporter_name: str, articles: list) -> None:
-    """Run relevance classification if not already done."""
+def _classify_if_needed(
+    reporter_id: int, reporter_name: str, articles: list
+) -> Optional[Tuple[bool, str]]:
+    """Run relevance classification if not already done.
+
+    Returns the new (relevant, rationale), or None if nothing was classified.
+    """
     existing = get_relevance(reporter_id)
     if existing is not None:
-        return  # Already classified — never re-evaluate
+        return None  # Already classified — never re-evaluate
+
+    result = _classify(reporter_name, articles)
+    if result is not None:
+        update_relevance(reporter_id, *result)
+    return result
 
+
+def _classify(reporter_name: str, articles: list) -> Optional[Tuple[bool, str]]:
+    """Classify relevance from articles without storing it; None if no articles."""
     if not articles:
-        return  # No articles to classify on
+        return None  # No articles to classify on
 
-    outlets = set(a.get("outlet", "") for a in articles if a.get("outlet"))
+    outlets = {a.get("outlet") for a in articles}
+    outlets.discard(None)
+    outlets.discard("")
     summaries = [
         a.get("summary") or a.get("headline", "")
         for a in articles
     ]
-    relevant, rationale = classify_reporter(reporter_name, outlets, summaries)
-    update_relevance(reporter_id, relevant, rationale)
+    return classify_reporter(reporter_name, outlets, summaries)
 
 
-@router.get("/reporter/{name}", response_model=ReporterDossier)
-async def get_reporter_dossier(name: str, refresh: bool = False):
-    """Get a comprehensive dossier for a reporter.
+# Reporter ids with a background classification queued or running
+_classifying: Set[int] = set()
 
-    3-tier cache-first architecture:
-    - Tier 2: Fresh DB hit — returns instantly, no API calls
-    - Tier 3: Stale or forced refresh — incremental update from Perigon
-    - Tier 1: Cold start — full fetch from Perigon, stores everything
+
+async def _classify_in_background(
+    reporter_id: int, reporter_name: str, articles: list, name_key: str
+) -> None:
+    """Classify after the response has gone out, then drop the stale cached dossier.
+
+    Only the classification runs in a worker thread; the cache and the
+    pending set are touched on the event loop, like everywhere else.
     """
-    name = name.strip()
-    if not name or len(name) < 2:
-        raise HTTPException(
-            status_code=400,
-            detail="Reporter name must be at least 2 characters"
+    try:
+        result = await asyncio.to_thread(
+            _classify_if_needed, reporter_id, reporter_name, articles
         )
+        if result is not None:
+            _dossier_cache.pop(name_key)
+    finally:
+        _classifying.discard(reporter_id)
+
+
+async def _profile_and_classify(
+    reporter_name: str,
+    articles: list,
+    social_title: Optional[str],
+    classify: bool,
+    stored_profile: Optional[Tuple[Optional[str], str]] = None,
+) -> Tuple[Tuple[Optional[str], Optional[str]], Optional[Tuple[bool, str]]]:
+    """Generate the profile and (optionally) classify relevance concurrently.
+
+    Both are independent blocking LLM calls, so they run in worker threads.
+    A stored_profile (current_outlet, reporter_bio) is reused as is instead
+    of generating one.
+    """
+    if stored_profile is not None:
+        if not classify:
+            return stored_profile, None
+        return stored_profile, await asyncio.to_thread(_classify, reporter_name, articles)
 
-    reporter = get_reporter(name)
+    profile_call = asyncio.to_thread(
+        generate_reporter_profile, reporter_name, articles, social_title
+    )
+    if not classify:
+        return await profile_call, None
+    return await asyncio.gather(
+        profile_call, asyncio.to_thread(_classify, reporter_name, articles)
+    )
 
-    # --- Tier 2: Fresh DB hit ---
-    if reporter and is_reporter_fresh(reporter) and not refresh:
-        db_articles = get_reporter_articles(reporter["id"])
-        if db_articles:
-            # Classify if not yet evaluated
-            if reporter.get("pro_services_relevant") is None:
-                articles_for_classify = [
-                    {"outlet": a["outlet"], "summary": a.get("summary"), "headline": a["headline"]}
-                    for a in db_articles
-                ]
-                _classify_if_needed(reporter["id"], name, articles_for_classify)
-                reporter = get_reporter(name)  # Re-fetch with classification
-            return build_dossier_from_db(reporter)
 
+def _apply_relevance(reporter: dict, result: Optional[Tuple[bool, str]]) -> None:
+    """Mirror a fresh classification onto an in-memory reporter record."""
+    if result is not None:
+        reporter["pro_services_relevant"], reporter["relevance_rationale"] = result
+
+
+class DossierCache:
+    """Size- and TTL-bounded cache of built dossiers (name key -> (validators, dossier)).
+
+    Validators are None for dossiers that aren't backed by a stored record.
+
+    Entries are kept in insertion order, so the oldest is always at the front
+    and eviction pops from the head, as in csv_import.PendingStore.
+    ReporterDossier is frozen, so cached instances are safe to share.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Optional[Dict[str, str]], ReporterDossier]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Tuple[Optional[Dict[str, str]], ReporterDossier]]:
+        """Return (validators, dossier) for a key, or None if missing/expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic() - self._ttl:
+            del self._entries[key]
+            return None
+        return entry[1], entry[2]
+
+    def __setitem__(
+        self, key: str, value: Tuple[Optional[Dict[str, str]], ReporterDossier]
+    ) -> None:
+        self._entries[key] = (time.monotonic(), *value)
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def pop(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def _evict(self) -> None:
+        """Drop expired entries, then the oldest ones beyond the size cap."""
+        cutoff = time.monotonic() - self._ttl
+        while self._entries:
+            created_at = next(iter(self._entries.values()))[0]
+            if created_at > cutoff and len(self._entries) <= self._max_size:
+                break
+            self._entries.popitem(last=False)
+
+
+_dossier_cache = DossierCache(DOSSIER_CACHE_MAX_SIZE, DOSSIER_CACHE_TTL_SECONDS)
+_empty_dossier_cache = DossierCache(DOSSIER_CACHE_MAX_SIZE, EMPTY_DOSSIER_CACHE_TTL_SECONDS)
+
+
+def _dossier_etag(reporter: dict, article_count: int) -> str:
+    """Strong ETag for a stored dossier; changes whenever the record is rewritten."""
+    relevant = reporter.get("pro_services_relevant")
+    key = "{}|{}|{}|{}".format(
+        reporter["id"],
+        reporter.get("last_updated") or "",
+        article_count,
+        "" if relevant is None else int(relevant),  # DB gives 0/1, memory a bool
+    )
+    return '"' + hashlib.blake2b(key.encode(), digest_size=8).hexdigest() + '"'
+
+
+def _dossier_last_modified(reporter: dict) -> Optional[datetime]:
+    """Latest write to the record: profile refresh or relevance classification.
+
+    Timestamps are stored as naive local time; the result is aware UTC,
+    truncated to the whole seconds HTTP dates carry.
+    """
+    stamps = []
+    for field in ("last_updated", "relevance_evaluated_at"):
+        value = reporter.get(field)
+        if isinstance(value, str):
+            try:
+                stamps.append(datetime.fromisoformat(value))
+            except ValueError:
+                pass
+    if not stamps:
+        return None
+    return max(stamps).astimezone(timezone.utc).replace(microsecond=0)
+
+
+def _dossier_validators(reporter: dict, article_count: int) -> Dict[str, str]:
+    """ETag and (if known) Last-Modified headers for a stored dossier."""
+    headers = {"ETag": _dossier_etag(reporter, article_count)}
+    last_modified = _dossier_last_modified(reporter)
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    return headers
+
+
+def _is_not_modified(request: Request, validators: Dict[str, str]) -> bool:
+    """Evaluate conditional headers; If-None-Match wins over If-Modified-Since."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # A list of entity tags, or "*"; compared weakly (W/ prefixes ignored)
+        etag = validators["ETag"].removeprefix("W/")
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag == "*" or tag.removeprefix("W/") == etag:
+                return True
+        return False
+
+    if_modified_since = request.headers.get("if-modified-since")
+    last_modified = validators.get("Last-Modified")
+    if not if_modified_since or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False  # not a valid HTTP date
+    return parsedate_to_datetime(last_modified) <= since
+
+
+def _send_dossier(
+    request: Request,
+    response: Response,
+    validators: Dict[str, str],
+    dossier: ReporterDossier,
+) -> Union[ReporterDossier, Response]:
+    """Attach caching headers, answering a satisfied conditional GET with a bare 304.
+
+    Only the browser may keep a dossier (private); shared proxies must not.
+    """
+    cache_headers = {**validators, "Cache-Control": "private, max-age=60"}
+    if _is_not_modified(request, validators):
+        return Response(status_code=304, headers=cache_headers)
+    response.headers.update(cache_headers)
+    return dossier
+
+
+def _store_dossier(
+    reporter: dict, db_articles: List[dict], social_links: Optional[dict] = None
+) -> Tuple[Dict[str, str], ReporterDossier]:
+    """Build and cache the dossier for a stored reporter. Returns (validators, dossier)."""
+    validators = _dossier_validators(reporter, len(db_articles))
+    dossier = build_dossier_from_db(reporter, db_articles, social_links)
+    name_key = normalize_name(reporter["name"])
+    _dossier_cache[name_key] = (validators, dossier)
+    _empty_dossier_cache.pop(name_key)
+    return validators, dossier
+
+
+def _empty_dossier(name: str, social_links: Optional[SocialLinks] = None) -> ReporterDossier:
+    """Dossier for a reporter with no stored record (nothing to validate against)."""
+    return ReporterDossier(
+        reporter_name=name,
+        query_date=date.today(),
+        articles=[],
+        social_links=social_links,
+        outlet_change_detected=False,
+        outlet_change_note=None,
+    )
+
+
+def _store_empty_dossier(
+    name_key: str, name: str, social_links: Optional[SocialLinks]
+) -> Tuple[None, ReporterDossier]:
+    """Build and cache the empty dossier for a confirmed Perigon miss."""
+    dossier = _empty_dossier(name, social_links)
+    _empty_dossier_cache[name_key] = (None, dossier)
+    return None, dossier
+
+
+# In-flight Tier 3/1 fetches by name key, shared by concurrent requests
+_inflight: Dict[str, "asyncio.Task[Tuple[Optional[Dict[str, str]], ReporterDossier]]"] = {}
+
+
+async def _coalesce(
+    name_key: str,
+    fetch: Callable[[], Awaitable[Tuple[Optional[Dict[str, str]], ReporterDossier]]],
+) -> Tuple[Optional[Dict[str, str]], ReporterDossier]:
+    """Await the in-flight fetch for name_key, starting one if there is none.
+
+    The fetch runs as its own task behind asyncio.shield, so a client that
+    disconnects doesn't cancel it for everyone else waiting on it.
+    """
+    task = _inflight.get(name_key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _inflight[name_key] = task
+        task.add_done_callback(lambda _: _inflight.pop(name_key, None))
+    return await asyncio.shield(task)
+
+
+def _save_refresh(
+    reporter_id: int,
+    new_articles: List[dict],
+    current_outlet: Optional[str],
+    reporter_bio: Optional[str],
+    relevance: Optional[Tuple[bool, str]],
+) -> Tuple[Optional[List[dict]], str]:
+    """Store a Tier 3 refresh in one transaction.
+
+    Returns (all articles if any were inserted, else None; new last_updated).
+    """
+    reloaded = None
+    with transaction() as conn:
+        if insert_articles(reporter_id, new_articles, conn=conn):
+            reloaded = get_reporter_articles(reporter_id, conn=conn)
+        last_updated = update_reporter_profile(
+            reporter_id, current_outlet, reporter_bio, conn=conn
+        )
+        if relevance is not None:
+            update_relevance(reporter_id, *relevance, conn=conn)
+    return reloaded, last_updated
+
+
+def _save_new_reporter(
+    name: str,
+    journalist_id: str,
+    social_links: Optional[dict],
+    current_outlet: Optional[str],
+    reporter_bio: Optional[str],
+    articles: List[dict],
+    relevance: Optional[Tuple[bool, str]],
+) -> Tuple[Optional[dict], List[dict]]:
+    """Store a Tier 1 cold start in one transaction and read the record back."""
+    with transaction() as conn:
+        reporter_id = upsert_reporter(
+            name=name,
+            perigon_id=journalist_id,
+            social_links=social_links,
+            current_outlet=current_outlet,
+            bio=reporter_bio,
+            source="perigon",
+            conn=conn,
+        )
+        insert_articles(reporter_id, articles, conn=conn)
+        if relevance is not None:
+            update_relevance(reporter_id, *relevance, conn=conn)
+    return get_reporter_with_articles(name)
+
+
+async def _fetch_dossier(
+    name: str, name_key: str, reporter: Optional[dict], db_articles: List[dict]
+) -> Tuple[Optional[Dict[str, str]], ReporterDossier]:
+    """Tiers 3 and 1: bring a reporter up to date from Perigon and store it.
+
+    Returns (validators, dossier); validators are None for dossiers that
+    aren't backed by a stored record.
+    """
     # --- Tier 3: Stale or forced refresh (incremental) ---
     if reporter and reporter.get("perigon_journalist_id"):
         journalist_id = reporter["perigon_journalist_id"]
         reporter_id = reporter["id"]
+        _dossier_cache.pop(name_key)
 
-        # Determine incremental fetch boundary
-        latest_date = get_latest_article_date(reporter_id)
+        # Determine incremental fetch boundary (articles are sorted newest first)
+        latest_date = next((a["date"] for a in db_articles if a["date"]), None)
         since_date = None
-        if latest_date:
-            next_day = (date.fromisoformat(latest_date) + timedelta(days=1)).isoformat()
-            since_date = next_day
+        latest = _parse_date(latest_date)
+        if latest is not None:
+            since_date = (latest + timedelta(days=1)).isoformat()
 
-        # Fetch only new articles from Perigon
-        new_articles = await fetch_articles_since(journalist_id, since_date)
+        # Fetch only new articles from Perigon. If that fails, serve the
+        # stored dossier as it is and leave last_updated alone, so the next
+        # request tries again instead of the record counting as refreshed.
+        try:
+            new_articles = await fetch_articles_since(journalist_id, since_date)
+        except PerigonUnavailable:
+            logger.warning("Perigon refresh failed for %r; serving stored dossier", name, exc_info=True)
+            return _store_dossier(reporter, db_articles)
         new_articles = deduplicate_by_headline(new_articles)
 
         if new_articles:
-            # Summarize only the new articles
+            # Drop articles already stored (by URL, or as a syndicated copy
+            # of a stored headline) before paying to summarize them
+            known_urls = {a["url"] for a in db_articles}
+            known_headlines = {normalize_headline(a["headline"] or "") for a in db_articles}
+            new_articles = [
+                a for a in new_articles
+                if a.get("url") not in known_urls
+                and normalize_headline(a.get("headline", "")) not in known_headlines
+            ]
             new_articles = await summarize_headlines(new_articles)
-            insert_articles(reporter_id, new_articles)
 
-        # Regenerate profile with ALL articles (old + new)
-        all_db_articles = get_reporter_articles(reporter_id)
+        # Regenerate profile with ALL articles (new ones are newer than any stored)
         all_articles_dicts = [
             {
                 "headline": a["headline"],
@@ -253,33 +521,52 @@ async def get_reporter_dossier(name: str, refresh: bool = False):
                 "summary": a.get("summary"),
                 "topics": a.get("topics", []),
             }
-            for a in all_db_articles
+            for a in new_articles + db_articles
         ]
 
-        # Get social title for profile generation
-        social_title = None
-        if reporter.get("social_links_json"):
-            try:
-                sl = json.loads(reporter["social_links_json"])
-                social_title = sl.get("title")
-            except (json.JSONDecodeError, TypeError):
-                pass
+        # Social title for profile generation; the parsed links are reused
+        # when building the dossier
+        social_links = _parse_social_links(reporter)
+        social_title = social_links.get("title")
+
+        # Without new articles the profile's input is unchanged, so the
+        # stored profile is kept rather than regenerated
+        stored_profile = None
+        if not new_articles and reporter.get("reporter_bio"):
+            stored_profile = (reporter.get("current_outlet"), reporter["reporter_bio"])
+
+        # Classify alongside, if not yet evaluated
+        (current_outlet, reporter_bio), relevance = await _profile_and_classify(
+            name,
+            all_articles_dicts,
+            social_title,
+            classify=reporter.get("pro_services_relevant") is None,
+            stored_profile=stored_profile,
+        )
 
-        current_outlet, reporter_bio = generate_reporter_profile(
-            name, all_articles_dicts, social_title
+        # All LLM work is done; apply every write in one transaction
+        reloaded, last_updated = await asyncio.to_thread(
+            _save_refresh, reporter_id, new_articles, current_outlet, reporter_bio, relevance
         )
-        update_reporter_profile(reporter_id, current_outlet, reporter_bio)
+        if reloaded is not None:
+            db_articles = reloaded
 
-        # Classify if not yet evaluated
-        if reporter.get("pro_services_relevant") is None:
-            _classify_if_needed(reporter_id, name, all_articles_dicts)
+        # Apply the same changes to the in-memory record instead of re-reading it
+        reporter["current_outlet"] = current_outlet
+        reporter["reporter_bio"] = reporter_bio
+        reporter["last_updated"] = last_updated
+        _apply_relevance(reporter, relevance)
 
-        # Re-fetch the updated reporter record
-        reporter = get_reporter(name)
-        return build_dossier_from_db(reporter)
+        return _store_dossier(reporter, db_articles, social_links)
 
     # --- Tier 1: Cold start (no record) ---
-    journalist_data = await search_and_get_journalist(name)
+    # Journalist details and the full 365-day fetch go out together
+    try:
+        journalist_data, articles = await search_journalist_with_articles(name)
+    except PerigonUnavailable:
+        # Not a confirmed miss: answer empty, but don't remember it
+        logger.warning("Perigon lookup failed for %r", name, exc_info=True)
+        return None, _empty_dossier(name)
 
     social_links_data = journalist_data.get("social_links") if journalist_data else None
     social_links = None
@@ -293,58 +580,114 @@ async def get_reporter_dossier(name: str, refresh: bool = False):
         )
 
     if not journalist_data:
-        return ReporterDossier(
-            reporter_name=name,
-            query_date=date.today(),
-            articles=[],
-            social_links=social_links,
-            outlet_change_detected=False,
-            outlet_change_note=None,
-        )
+        return _store_empty_dossier(name_key, name, social_links)
 
     journalist_id = journalist_data["id"]
-
-    # Full 365-day fetch
-    articles = await fetch_articles_since(journalist_id)
     articles = deduplicate_by_headline(articles)
 
     if not articles:
-        upsert_reporter(
+        await asyncio.to_thread(
+            upsert_reporter,
             name=name,
             perigon_id=journalist_id,
             social_links=social_links_data,
             source="perigon",
         )
-        return ReporterDossier(
-            reporter_name=name,
-            query_date=date.today(),
-            articles=[],
-            social_links=social_links,
-            outlet_change_detected=False,
-            outlet_change_note=None,
-        )
+        return _store_empty_dossier(name_key, name, social_links)
 
     # Summarize all articles
     articles = await summarize_headlines(articles)
 
-    # Generate profile
+    # Generate profile, and classify relevance for new reporters alongside
     social_title = social_links_data.get("title") if social_links_data else None
-    current_outlet, reporter_bio = generate_reporter_profile(name, articles, social_title)
-
-    # Store reporter and articles
-    reporter_id = upsert_reporter(
-        name=name,
-        perigon_id=journalist_id,
-        social_links=social_links_data,
-        current_outlet=current_outlet,
-        bio=reporter_bio,
-        source="perigon",
+    (current_outlet, reporter_bio), relevance = await _profile_and_classify(
+        name,
+        articles,
+        social_title,
+        classify=reporter is None or reporter.get("pro_services_relevant") is None,
     )
-    insert_articles(reporter_id, articles)
 
-    # Classify relevance for new reporters
-    _classify_if_needed(reporter_id, name, articles)
+    # Store reporter, articles and relevance together, then return from DB
+    # for consistency
+    reporter, db_articles = await asyncio.to_thread(
+        _save_new_reporter,
+        name,
+        journalist_id,
+        social_links_data,
+        current_outlet,
+        reporter_bio,
+        articles,
+        relevance,
+    )
+    return _store_dossier(reporter, db_articles)
+
+
+@router.get("/reporter/{name}", response_model=ReporterDossier)
+async def get_reporter_dossier(
+    name: str,
+    request: Request,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    refresh: bool = False,
+):
+    """Get a comprehensive dossier for a reporter.
+
+    3-tier cache-first architecture:
+    - Tier 2: Fresh DB hit — returns instantly, no API calls
+    - Tier 3: Stale or forced refresh — incremental update from Perigon
+    - Tier 1: Cold start — full fetch from Perigon, stores everything
+
+    Dossiers built from the DB are kept in-process for
+    DOSSIER_CACHE_TTL_SECONDS and carry ETag/Last-Modified validators; a
+    satisfied If-None-Match or If-Modified-Since gets a 304. Empty dossiers
+    are kept for EMPTY_DOSSIER_CACHE_TTL_SECONDS.
+    """
+    name = name.strip()
+    if not name or len(name) < 2:
+        raise HTTPException(
+            status_code=400,
+            detail="Reporter name must be at least 2 characters"
+        )
+
+    name_key = normalize_name(name)
+    if not refresh:
+        cached = _dossier_cache.get(name_key) or _empty_dossier_cache.get(name_key)
+        if cached is not None:
+            validators, dossier = cached
+            if validators is None:
+                return dossier
+            return _send_dossier(request, response, validators, dossier)
 
-    # Return from DB for consistency
-    reporter = get_reporter(name)
-    return build_dossier_from_db(reporter)
+    # The store is synchronous sqlite3: DB work runs in worker threads so
+    # it never blocks the event loop
+    reporter, db_articles = await asyncio.to_thread(get_reporter_with_articles, name)
+
+    # --- Tier 2: Fresh DB hit ---
+    if reporter and is_reporter_fresh(reporter) and not refresh:
+        if db_articles:
+            # Classify if not yet evaluated, after responding. Requests that
+            # arrive while a classification is pending don't queue another.
+            if (
+                reporter.get("pro_services_relevant") is None
+                and reporter["id"] not in _classifying
+            ):
+                _classifying.add(reporter["id"])
+                # The stored article dicts already carry outlet/summary/headline
+                background_tasks.add_task(
+                    _classify_in_background, reporter["id"], name, db_articles, name_key
+                )
+
+            # Built and cached even for a 304, so later revalidations are
+            # answered from memory instead of going back to SQLite
+            validators, dossier = _store_dossier(reporter, db_articles)
+            return _send_dossier(request, response, validators, dossier)
+
+    # --- Tiers 3 and 1 ---
+    # Concurrent requests for the same reporter share one fetch: the LLM
+    # summaries, profile and writes happen once, not once per request
+    validators, dossier = await _coalesce(
+        name_key, lambda: _fetch_dossier(name, name_key, reporter, db_articles)
+    )
+    if validators is None:
+        return dossier
+    return _send_dossier(request, response, validators, dossier)
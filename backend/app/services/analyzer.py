@@ -9,8 +9,8 @@ def most_common_outlet(articles: List[dict]) -> Optional[str]:
     """Get the most common outlet from a list of articles."""
     if not articles:
         return None
-    outlet_counts = Counter(a["outlet"] for a in articles)
-    most_common = outlet_counts.most_common(1)
+    # .get: also the profile fallback's error path, so never raise here
+    most_common = Counter(a.get("outlet", "") for a in articles).most_common(1)
     return most_common[0][0] if most_common else None
 
 
@@ -27,34 +27,33 @@ def detect_outlet_change(articles: List[dict]) -> Tuple[bool, Optional[str]]:
     today = date.today()
     six_months_ago = today - timedelta(days=180)
 
-    # Parse dates and split into recent/older
-    recent = []
-    older = []
+    # Count outlets per period in a single pass, without splitting the list
+    recent = Counter()
+    older = Counter()
 
     for article in articles:
         article_date = article["date"]
         if isinstance(article_date, str):
             article_date = date.fromisoformat(article_date)
 
-        if article_date >= six_months_ago:
-            recent.append(article)
-        else:
-            older.append(article)
+        period = recent if article_date >= six_months_ago else older
+        period[article["outlet"]] += 1
+
+    recent_total = sum(recent.values())
+    older_total = sum(older.values())
 
     # Need articles in both periods to detect change
-    if len(recent) < 2 or len(older) < 2:
+    if recent_total < 2 or older_total < 2:
         return False, None
 
-    recent_primary = most_common_outlet(recent)
-    older_primary = most_common_outlet(older)
+    # One count per period serves both the primary outlet and its share
+    recent_primary, recent_top = recent.most_common(1)[0]
+    older_primary, older_top = older.most_common(1)[0]
 
     if recent_primary and older_primary and recent_primary != older_primary:
         # Count how dominant the outlets are
-        recent_counts = Counter(a["outlet"] for a in recent)
-        older_counts = Counter(a["outlet"] for a in older)
-
-        recent_pct = recent_counts[recent_primary] / len(recent) * 100
-        older_pct = older_counts[older_primary] / len(older) * 100
+        recent_pct = recent_top / recent_total * 100
+        older_pct = older_top / older_total * 100
 
         # Only flag if the outlets were dominant in their periods
         if recent_pct >= 40 and older_pct >= 40:
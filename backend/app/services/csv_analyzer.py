@@ -1,26 +1,44 @@
 """Claude Haiku service for analyzing CSV structure and mapping columns."""
 
-import json
 import os
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 import anthropic
-from dotenv import load_dotenv
+import orjson
 
 
-load_dotenv()
-
 MODEL = "claude-3-haiku-20240307"
 
+# Sample cells longer than this are truncated in the analysis prompt
+MAX_CELL_CHARS = 120
+
+# Header keywords per field for _fallback_mapping, in priority order
+_FALLBACK_KEYWORDS = {
+    "name": ("name", "reporter", "journalist", "contact"),
+    "outlet": ("outlet", "publication", "org", "media", "paper", "newspaper"),
+    "bio": ("bio", "description", "notes", "beat", "about"),
+    "twitter": ("twitter", "x.com", "handle"),
+    "linkedin": ("linkedin",),
+}
 
+
+@lru_cache(maxsize=1)
 def get_client() -> anthropic.Anthropic:
-    """Get Anthropic client."""
+    """Get the shared Anthropic client, reusing its connection pool across calls."""
     api_key = os.getenv("ANTHROPIC_API_KEY")
     if not api_key:
         raise ValueError("ANTHROPIC_API_KEY environment variable not set")
     return anthropic.Anthropic(api_key=api_key)
 
 
+def close_client() -> None:
+    """Close the shared client, if one was created (on application shutdown)."""
+    if get_client.cache_info().currsize:
+        get_client().close()
+        get_client.cache_clear()
+
+
 def analyze_csv_with_claude(
     headers: List[str], sample_rows: List[List[str]]
 ) -> Dict:
@@ -28,11 +46,11 @@ def analyze_csv_with_claude(
 
     Returns dict with: column_mapping, normalizations, issues, confidence.
     """
-    # Format as pipe-delimited table
-    table_lines = [" | ".join(headers)]
-    table_lines.append(" | ".join("---" for _ in headers))
-    for row in sample_rows[:10]:
-        table_lines.append(" | ".join(str(v) for v in row))
+    # Format as pipe-delimited table; long cells are cut to bound the prompt
+    table_lines = [" | ".join(headers), " | ".join(["---"] * len(headers))]
+    table_lines += [
+        " | ".join([str(v)[:MAX_CELL_CHARS] for v in row]) for row in sample_rows[:10]
+    ]
     table_text = "\n".join(table_lines)
 
     prompt = f"""You are analyzing a CSV file containing reporter/journalist contact data for a PR tool.
@@ -71,39 +89,30 @@ Return ONLY valid JSON, no explanation."""
         if response_text.startswith("```"):
             response_text = response_text.split("\n", 1)[1].rsplit("```", 1)[0].strip()
 
-        return json.loads(response_text)
+        return orjson.loads(response_text)
 
-    except (anthropic.APIError, json.JSONDecodeError, ValueError, KeyError):
+    except (anthropic.APIError, orjson.JSONDecodeError, ValueError, KeyError):
         return _fallback_mapping(headers)
 
 
 def _fallback_mapping(headers: List[str]) -> Dict:
     """Naive keyword-based column mapping when Claude API is unavailable."""
-    lower_headers = {h: h.lower() for h in headers}
-    mapping = {
-        "name": None,
-        "outlet": None,
-        "bio": None,
-        "twitter": None,
-        "linkedin": None,
-    }
-
-    for header, lower in lower_headers.items():
-        if any(k in lower for k in ("name", "reporter", "journalist", "contact")):
-            if not mapping["name"]:
-                mapping["name"] = header
-        elif any(k in lower for k in ("outlet", "publication", "org", "media", "paper", "newspaper")):
-            if not mapping["outlet"]:
-                mapping["outlet"] = header
-        elif any(k in lower for k in ("bio", "description", "notes", "beat", "about")):
-            if not mapping["bio"]:
-                mapping["bio"] = header
-        elif any(k in lower for k in ("twitter", "x.com", "handle")):
-            if not mapping["twitter"]:
-                mapping["twitter"] = header
-        elif any(k in lower for k in ("linkedin",)):
-            if not mapping["linkedin"]:
-                mapping["linkedin"] = header
+    mapping = dict.fromkeys(_FALLBACK_KEYWORDS)
+    unmapped = len(mapping)
+
+    for header in headers:
+        lower = header.lower()
+        # The first field with a keyword in the header claims it, if free
+        field = next(
+            (f for f, keywords in _FALLBACK_KEYWORDS.items()
+             if any(k in lower for k in keywords)),
+            None,
+        )
+        if field is not None and not mapping[field]:
+            mapping[field] = header
+            unmapped -= 1
+            if not unmapped:
+                break
 
     return {
         "column_mapping": mapping,
@@ -0,0 +1,105 @@
+"""Syndicated-article deduplication."""
+
+import sys
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from ..db.headlines import normalize_headline
+
+
+# Headlines that differ only by these words are the same story, e.g.
+# "NYT: Trump avoids impeachment" and "Trump avoids impeachment": wire and
+# outlet tags and boilerplate labels, never words that could be the news
+NEAR_DUPLICATE_NOISE_WORDS = frozenset({
+    "ap", "afp", "upi", "reuters", "bloomberg", "nyt", "wsj", "wapo",
+    "cnn", "bbc", "npr", "cnbc", "axios", "politico",
+    "update", "updated", "updates", "breaking", "exclusive", "live",
+    "watch", "video", "photos", "opinion", "analysis", "report",
+})
+# Shorter headlines only match exactly; a single word decides too much
+NEAR_DUPLICATE_MIN_WORDS = 3
+
+# Outlet priority for deduplication (higher = preferred)
+OUTLET_PRIORITY = {
+    "New York Times": 100,
+    "Wall Street Journal": 100,
+    "Washington Post": 100,
+    "Bloomberg": 95,
+    "Reuters": 95,
+    "AP News": 95,
+    "Politico": 90,
+    "The Atlantic": 90,
+    "Axios": 85,
+    "CNN": 80,
+    "NBC News": 80,
+    "CBS News": 80,
+    "ABC News": 80,
+    "NPR": 80,
+    "Los Angeles Times": 75,
+    "Chicago Tribune": 75,
+    "Boston Globe": 75,
+    "Seattle Times": 70,
+    "Miami Herald": 70,
+    "SF Chronicle": 70,
+}
+# Interned keys: perigon interns outlet names too, so lookups for known
+# outlets match on identity without a string compare
+OUTLET_PRIORITY = {sys.intern(k): v for k, v in OUTLET_PRIORITY.items()}
+
+
+def _rank_date(story: list) -> str:
+    return story[0][1]
+
+
+@lru_cache(maxsize=16384)
+def _core_headline(key: str) -> Optional[str]:
+    """A normalized headline without its noise words, in order.
+
+    None if fewer than NEAR_DUPLICATE_MIN_WORDS words remain.
+    """
+    words = [w for w in key.split() if w not in NEAR_DUPLICATE_NOISE_WORDS]
+    if len(words) < NEAR_DUPLICATE_MIN_WORDS:
+        return None
+    return " ".join(words)
+
+
+def deduplicate_by_headline(articles: list) -> list:
+    """Remove duplicate syndicated articles, keeping the primary outlet version.
+
+    Articles are grouped by normalized headline; headlines that differ only
+    by NEAR_DUPLICATE_NOISE_WORDS join the same group, while any other word
+    (a place, a name, a number) keeps stories apart. This is a single pass
+    that keeps only the best (priority, date) version of each story, so no
+    per-group lists are built or sorted; the survivors are sorted once.
+    """
+    # Per story: [rank, article] of the best version seen so far. The rank
+    # is computed once per article; ties keep the earlier article.
+    stories: List[list] = []
+    story_by_key: Dict[str, int] = {}
+    story_by_core: Dict[str, int] = {}
+    priority = OUTLET_PRIORITY.get
+
+    for article in articles:
+        key = normalize_headline(article.get("headline", ""))
+        if not key:
+            continue
+        rank = (priority(article.get("outlet", ""), 0), article.get("date", ""))
+
+        index = story_by_key.get(key)
+        if index is None:
+            core = _core_headline(key)
+            index = story_by_core.get(core) if core else None
+            if index is None:
+                index = len(stories)
+                stories.append([rank, article])
+                if core:
+                    story_by_core[core] = index
+            story_by_key[key] = index
+
+        story = stories[index]
+        if rank > story[0]:
+            story[0], story[1] = rank, article
+
+    # Newest first, reusing the date already decorated into each rank
+    stories.sort(key=_rank_date, reverse=True)
+    return [article for _, article in stories]
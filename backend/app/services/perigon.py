@@ -4,64 +4,154 @@ Perigon has excellent journalist coverage (230K+ journalists) with proper
 author attribution. This is the primary data source for Madison Mentions.
 """
 
+import asyncio
 import os
-from datetime import datetime, timedelta
-from typing import List, Optional
+import re
+import sys
+from datetime import date, timedelta
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from typing import List, Optional, Tuple
 
 import httpx
-from dotenv import load_dotenv
-
-load_dotenv()
+import orjson
 
 PERIGON_BASE_URL = "https://api.goperigon.com/v1"
 REQUEST_TIMEOUT = 30.0
+# Keep-alive connections held open to the Perigon host between requests,
+# and how long an idle one is kept (httpx's default is 5s, shorter than
+# the usual gap between reporter lookups)
+MAX_KEEPALIVE_CONNECTIONS = 8
+KEEPALIVE_EXPIRY_SECONDS = 60.0
+# Cap on concurrent Perigon requests across all lookups. Requests beyond it
+# wait for a free connection (up to REQUEST_TIMEOUT) rather than bursting
+# into Perigon's rate limit.
+MAX_CONNECTIONS = 10
+# Rate-limited (429) requests are retried this many times, waiting for the
+# server's Retry-After (or an exponential backoff), but never longer than
+# MAX_RETRY_WAIT_SECONDS per attempt
+MAX_RETRIES = 2
+RETRY_BACKOFF_SECONDS = 1.0
+MAX_RETRY_WAIT_SECONDS = 10.0
+
+
+
+class PerigonUnavailable(Exception):
+    """Perigon couldn't be reached, or answered with an error (including 429)."""
+
+
+# One pooled client per event loop, so TCP/TLS setup is paid once rather
+# than per request (connections can't be shared across loops)
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared Perigon client, creating it for the running loop."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            timeout=REQUEST_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+            ),
+        )
+        _client_loop = loop
+    return _client
+
 
+async def close_client() -> None:
+    """Close the shared client (on application shutdown)."""
+    global _client, _client_loop
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
 
+
+@lru_cache(maxsize=1)
 def get_api_key() -> str:
-    """Get Perigon API key from environment."""
+    """Get Perigon API key from environment (read once; a missing key isn't cached)."""
     api_key = os.getenv("PERIGON_API_KEY")
     if not api_key:
         raise ValueError("PERIGON_API_KEY environment variable not set")
     return api_key
 
 
-async def search_journalist(
+async def _get(client: httpx.AsyncClient, url: str, params: dict) -> httpx.Response:
+    """GET from Perigon, retrying rate-limited responses after a short wait."""
+    for attempt in range(MAX_RETRIES):
+        response = await client.get(url, params=params, timeout=REQUEST_TIMEOUT)
+        if response.status_code != 429:
+            return response
+        wait = _retry_after_seconds(response)
+        if wait is None:
+            wait = RETRY_BACKOFF_SECONDS * 2 ** attempt
+        if wait > MAX_RETRY_WAIT_SECONDS:
+            return response  # Not worth holding the request open for
+        await asyncio.sleep(wait)
+    return await client.get(url, params=params, timeout=REQUEST_TIMEOUT)
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Retry-After in seconds, if the server sent it as a number."""
+    try:
+        return max(0.0, float(response.headers["Retry-After"]))
+    except (KeyError, ValueError):
+        return None
+
+
+async def find_journalist_id(
     client: httpx.AsyncClient,
     reporter_name: str,
     api_key: str
-) -> Optional[dict]:
-    """Search for a journalist by name and return their ID and social links."""
+) -> Optional[str]:
+    """Search for a journalist by name and return the first match's ID.
+
+    Returns None only when Perigon answers that there's no match; raises
+    PerigonUnavailable if the search itself fails.
+    """
     try:
-        response = await client.get(
+        response = await _get(
+            client,
             f"{PERIGON_BASE_URL}/journalists",
-            params={
+            {
                 "name": reporter_name,
                 "apiKey": api_key
             },
-            timeout=REQUEST_TIMEOUT
         )
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         results = data.get("results", [])
         if not results:
             return None
 
         # Get the first matching journalist
-        journalist = results[0]
-        journalist_id = journalist.get("id")
+        return results[0].get("id") or None
+
+    except (httpx.HTTPError, ValueError, AttributeError) as exc:
+        raise PerigonUnavailable(f"Journalist search failed: {exc!r}") from exc
 
-        if not journalist_id:
-            return None
 
-        # Fetch full journalist details for social links
-        detail_response = await client.get(
+async def fetch_journalist_details(
+    client: httpx.AsyncClient,
+    journalist_id: str,
+    api_key: str
+) -> Optional[dict]:
+    """Fetch full journalist details and return their ID and social links."""
+    try:
+        detail_response = await _get(
+            client,
             f"{PERIGON_BASE_URL}/journalists/{journalist_id}",
-            params={"apiKey": api_key},
-            timeout=REQUEST_TIMEOUT
+            {"apiKey": api_key},
         )
         detail_response.raise_for_status()
-        details = detail_response.json()
+        details = orjson.loads(detail_response.content)
 
         # Extract social links
         twitter_handle = details.get("twitterHandle")
@@ -80,19 +170,30 @@ async def search_journalist(
         return None
 
 
+@lru_cache(maxsize=1)
+def _default_from_date(today: date) -> str:
+    """Start of the default one-year article window; computed once per day."""
+    return (today - timedelta(days=365)).isoformat()
+
+
 async def fetch_articles_by_journalist(
     client: httpx.AsyncClient,
     journalist_id: str,
     api_key: str,
     from_date_override: Optional[str] = None,
 ) -> List[dict]:
-    """Fetch recent articles by a journalist ID."""
+    """Fetch recent articles by a journalist ID (raw Perigon items).
+
+    Raises PerigonUnavailable if the request fails, so callers can tell a
+    failed fetch from a journalist with no new articles.
+    """
     try:
-        from_date = from_date_override or (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
+        from_date = from_date_override or _default_from_date(date.today())
 
-        response = await client.get(
+        response = await _get(
+            client,
             f"{PERIGON_BASE_URL}/all",
-            params={
+            {
                 "journalistId": journalist_id,
                 "from": from_date,
                 "sortBy": "date",
@@ -100,351 +201,397 @@ async def fetch_articles_by_journalist(
                 "language": "en",  # English articles only
                 "apiKey": api_key
             },
-            timeout=REQUEST_TIMEOUT
         )
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         return data.get("articles", [])
 
-    except Exception:
-        return []
+    except (httpx.HTTPError, ValueError, AttributeError) as exc:
+        raise PerigonUnavailable(f"Article fetch for {journalist_id} failed: {exc!r}") from exc
 
 
 def parse_article(item: dict) -> Optional[dict]:
     """Parse a single article from Perigon response."""
-    try:
-        url = item.get("url", "")
-        title = item.get("title", "")
-
-        if not url or not title:
-            return None
-
-        # Parse publication date
-        pub_date = item.get("pubDate", "")
-        if pub_date:
-            try:
-                # Handle various ISO 8601 formats
-                # Replace Z with +00:00, then strip timezone for parsing
-                normalized = pub_date.replace("Z", "+00:00")
-                # Remove timezone offset for fromisoformat compatibility
-                if "+" in normalized:
-                    normalized = normalized.rsplit("+", 1)[0]
-                elif normalized.count("-") > 2:  # Has negative timezone
-                    normalized = normalized.rsplit("-", 1)[0]
-                article_date = datetime.fromisoformat(normalized).date()
-            except ValueError:
-                return None
-        else:
-            return None
-
-        # Get source/outlet
-        source = item.get("source", {})
-        domain = source.get("domain", "Unknown")
-        outlet = clean_outlet_name(domain)
-
-        # Extract topics (Perigon provides these)
-        topics_raw = item.get("topics", [])
-        categories_raw = item.get("categories", [])
-
-        # Combine topics and categories, dedupe
-        topics = []
-        seen = set()
-        for t in topics_raw + categories_raw:
-            name = t.get("name", "") if isinstance(t, dict) else str(t)
-            if name and name not in seen:
-                topics.append(name)
-                seen.add(name)
-
-        return {
-            "headline": title,
-            "outlet": outlet,
-            "date": article_date.isoformat(),
-            "url": url,
-            "topics": topics[:5],  # Limit to top 5 topics per article
-        }
+    url = item.get("url")
+    title = item.get("title")
+    pub_date = item.get("pubDate")
+    if not (
+        url and isinstance(url, str)
+        and title and isinstance(title, str)
+        and pub_date and isinstance(pub_date, str)
+    ):
+        return None
 
-    except (ValueError, KeyError, AttributeError):
+    # Parse publication date: ISO 8601 timestamp, whose local date is its
+    # first 10 chars whatever the time and offset that follow. The only
+    # step that can fail on a well-formed item, so the only one in a try.
+    try:
+        article_date = date.fromisoformat(pub_date[:10])
+    except (TypeError, ValueError):
         return None
 
+    # Get source/outlet (Perigon sends null for some missing fields; anything
+    # not shaped as expected counts as missing rather than failing the batch)
+    source = item.get("source")
+    if not isinstance(source, dict):
+        source = {}
+    domain = source.get("domain")
+    if not isinstance(domain, str):
+        domain = "Unknown"
+    # Interned (see clean_outlet_name), so dedup's OUTLET_PRIORITY
+    # lookups compare by identity
+    outlet = clean_outlet_name(domain)
+
+    # Extract topics (Perigon provides these)
+    topics_raw = item.get("topics")
+    if not isinstance(topics_raw, list):
+        topics_raw = ()
+    categories_raw = item.get("categories")
+    if not isinstance(categories_raw, list):
+        categories_raw = ()
+
+    # Combine topics and categories, dedupe (dict keeps first-seen order).
+    # Interned, as the same few topic names repeat across every article.
+    names = (
+        t.get("name") if isinstance(t, dict) else t
+        for t in chain(topics_raw, categories_raw)
+    )
+    topics = list(dict.fromkeys(sys.intern(str(n)) for n in names if n))
+
+    return {
+        "headline": title,
+        "outlet": outlet,
+        "date": article_date.isoformat(),
+        "url": url,
+        "topics": topics[:5],  # Limit to top 5 topics per article
+    }
 
+
+# Fallback naming: subdomain labels to skip, and trailing labels to drop
+_SKIP_PREFIXES = frozenset({"www", "news", "api", "m", "mobile", "amp", "cdn", "static"})
+_TLDS = frozenset({"com", "org", "net", "edu", "gov", "co", "uk", "io", "ai"})
+
+# Lower-to-upper boundaries in camelCase domain names
+_CAMEL_CASE_RE = re.compile(r'([a-z])([A-Z])')
+
+# Comprehensive domain mapping (domain without "www." -> display name)
+_DOMAIN_MAP = {
+    # Major national outlets
+    "nytimes.com": "New York Times",
+    "wsj.com": "Wall Street Journal",
+    "washingtonpost.com": "Washington Post",
+    "politico.com": "Politico",
+    "theatlantic.com": "The Atlantic",
+    "bloomberg.com": "Bloomberg",
+    "reuters.com": "Reuters",
+    "apnews.com": "AP News",
+    "cnn.com": "CNN",
+    "foxnews.com": "Fox News",
+    "nbcnews.com": "NBC News",
+    "cbsnews.com": "CBS News",
+    "abcnews.go.com": "ABC News",
+    "usatoday.com": "USA Today",
+    "latimes.com": "Los Angeles Times",
+    "chicagotribune.com": "Chicago Tribune",
+    "bostonglobe.com": "Boston Globe",
+    "sfchronicle.com": "SF Chronicle",
+    "axios.com": "Axios",
+    "thehill.com": "The Hill",
+    "businessinsider.com": "Business Insider",
+    "forbes.com": "Forbes",
+    "fortune.com": "Fortune",
+    "theguardian.com": "The Guardian",
+    "bbc.com": "BBC",
+    "bbc.co.uk": "BBC",
+    "economist.com": "The Economist",
+    "ft.com": "Financial Times",
+    "marketwatch.com": "MarketWatch",
+    "cnbc.com": "CNBC",
+    "npr.org": "NPR",
+    "time.com": "Time",
+    "newyorker.com": "The New Yorker",
+    "vanityfair.com": "Vanity Fair",
+    "rollingstone.com": "Rolling Stone",
+    "vox.com": "Vox",
+    "slate.com": "Slate",
+    "thedailybeast.com": "The Daily Beast",
+    "huffpost.com": "HuffPost",
+    "buzzfeednews.com": "BuzzFeed News",
+    "infobae.com": "Infobae",
+    "nzherald.co.nz": "NZ Herald",
+
+    # McClatchy newspapers
+    "miamiherald.com": "Miami Herald",
+    "sacbee.com": "Sacramento Bee",
+    "charlotteobserver.com": "Charlotte Observer",
+    "kansascity.com": "Kansas City Star",
+    "star-telegram.com": "Fort Worth Star-Telegram",
+    "newsobserver.com": "Raleigh News & Observer",
+    "thestate.com": "The State (SC)",
+    "kentucky.com": "Lexington Herald-Leader",
+    "kansas.com": "Wichita Eagle",
+    "bnd.com": "Belleville News-Democrat",
+    "bradenton.com": "Bradenton Herald",
+    "fresnobee.com": "Fresno Bee",
+    "modbee.com": "Modesto Bee",
+    "sanluisobispo.com": "San Luis Obispo Tribune",
+    "thenewstribune.com": "Tacoma News Tribune",
+    "bellinghamherald.com": "Bellingham Herald",
+    "theolympian.com": "The Olympian",
+    "tri-cityherald.com": "Tri-City Herald",
+    "idahostatesman.com": "Idaho Statesman",
+    "islandpacket.com": "Island Packet",
+    "heraldsun.com": "Durham Herald-Sun",
+    "ledger-enquirer.com": "Columbus Ledger-Enquirer",
+    "macon.com": "Macon Telegraph",
+    "myrtlebeachonline.com": "Myrtle Beach Sun News",
+    "sunherald.com": "Biloxi Sun Herald",
+
+    # Other regional papers
+    "adn.com": "Anchorage Daily News",
+    "seattletimes.com": "Seattle Times",
+    "sfexaminer.com": "SF Examiner",
+    "spokesman.com": "Spokesman-Review",
+    "denverpost.com": "Denver Post",
+    "dallasnews.com": "Dallas Morning News",
+    "houstonchronicle.com": "Houston Chronicle",
+    "ajc.com": "Atlanta Journal-Constitution",
+    "inquirer.com": "Philadelphia Inquirer",
+    "startribune.com": "Minneapolis Star Tribune",
+    "detroitnews.com": "Detroit News",
+    "freep.com": "Detroit Free Press",
+    "jsonline.com": "Milwaukee Journal Sentinel",
+    "dispatch.com": "Columbus Dispatch",
+    "cleveland.com": "Cleveland Plain Dealer",
+    "baltimoresun.com": "Baltimore Sun",
+    "orlandosentinel.com": "Orlando Sentinel",
+    "tampabay.com": "Tampa Bay Times",
+    "sun-sentinel.com": "South Florida Sun-Sentinel",
+    "azcentral.com": "Arizona Republic",
+    "reviewjournal.com": "Las Vegas Review-Journal",
+    "sltrib.com": "Salt Lake Tribune",
+    "oregonlive.com": "The Oregonian",
+
+    # International
+    "telegraph.co.uk": "The Telegraph",
+    "independent.co.uk": "The Independent",
+    "dailymail.co.uk": "Daily Mail",
+    "mirror.co.uk": "Daily Mirror",
+    "thesun.co.uk": "The Sun",
+    "thetimes.co.uk": "The Times (UK)",
+    "globeandmail.com": "Globe and Mail",
+    "torontosun.com": "Toronto Sun",
+    "smh.com.au": "Sydney Morning Herald",
+    "theaustralian.com.au": "The Australian",
+    "irishtimes.com": "Irish Times",
+    "scmp.com": "South China Morning Post",
+    "japantimes.co.jp": "Japan Times",
+    "straitstimes.com": "Straits Times",
+    "haaretz.com": "Haaretz",
+    "jpost.com": "Jerusalem Post",
+    "aljazeera.com": "Al Jazeera",
+    "dw.com": "Deutsche Welle",
+    "france24.com": "France 24",
+    "lemonde.fr": "Le Monde",
+    "spiegel.de": "Der Spiegel",
+    "elpais.com": "El Pais",
+
+    # Business/Finance
+    "barrons.com": "Barron's",
+    "fool.com": "Motley Fool",
+    "investopedia.com": "Investopedia",
+    "seekingalpha.com": "Seeking Alpha",
+    "thestreet.com": "TheStreet",
+    "finance.yahoo.com": "Yahoo Finance",
+    "money.cnn.com": "CNN Money",
+
+    # Tech
+    "techcrunch.com": "TechCrunch",
+    "theverge.com": "The Verge",
+    "wired.com": "Wired",
+    "arstechnica.com": "Ars Technica",
+    "engadget.com": "Engadget",
+    "cnet.com": "CNET",
+    "zdnet.com": "ZDNet",
+    "gizmodo.com": "Gizmodo",
+    "mashable.com": "Mashable",
+    "recode.net": "Recode",
+    "protocol.com": "Protocol",
+
+    # Sports
+    "espn.com": "ESPN",
+    "sports.yahoo.com": "Yahoo Sports",
+    "cbssports.com": "CBS Sports",
+    "si.com": "Sports Illustrated",
+    "theathletic.com": "The Athletic",
+    "bleacherreport.com": "Bleacher Report",
+
+    # Public radio/TV
+    "wlrn.org": "WLRN",
+    "wnyc.org": "WNYC",
+    "kqed.org": "KQED",
+    "wbur.org": "WBUR",
+    "pbs.org": "PBS",
+
+    # Legal/Business news
+    "bloomberglaw.com": "Bloomberg Law",
+    "law.com": "Law.com",
+    "law360.com": "Law360",
+
+    # Accounting/Finance trades
+    "accountingtoday.com": "Accounting Today",
+    "journalofaccountancy.com": "Journal of Accountancy",
+    "cpapracticeadvisor.com": "CPA Practice Advisor",
+    "cfodive.com": "CFO Dive",
+    "cfo.com": "CFO Magazine",
+    "complianceweek.com": "Compliance Week",
+
+    # Professional services / consulting
+    "consultancy.uk": "Consultancy.uk",
+    "consulting.us": "Consulting.us",
+    "hbr.org": "Harvard Business Review",
+    "mckinsey.com": "McKinsey",
+
+    # Regional business journals
+    "bizjournals.com": "The Business Journals",
+
+    # Industry Dive network
+    "hrdive.com": "HR Dive",
+    "supplychaindive.com": "Supply Chain Dive",
+    "ciodive.com": "CIO Dive",
+    "healthcaredive.com": "Healthcare Dive",
+    "marketingdive.com": "Marketing Dive",
+    "retaildive.com": "Retail Dive",
+    "constructiondive.com": "Construction Dive",
+    "bankingdive.com": "Banking Dive",
+    "biopharmadive.com": "BioPharma Dive",
+    "educationdive.com": "Education Dive",
+    "utilitydive.com": "Utility Dive",
+
+    # Other
+    "rp.pl": "Rzeczpospolita",
+    "fnlondon.com": "Financial News London",
+}
+# Display names are interned, like every name clean_outlet_name returns
+_DOMAIN_MAP = {k: sys.intern(v) for k, v in _DOMAIN_MAP.items()}
+
+
+@lru_cache(maxsize=4096)
 def clean_outlet_name(domain: str) -> str:
-    """Clean up domain name to display name."""
+    """Clean up domain name to display name (memoized; outlets repeat a lot).
+
+    The result is always an interned string.
+    """
     if not domain:
         return "Unknown"
 
-    # Normalize domain
-    domain = domain.lower().replace("www.", "")
-
-    # Comprehensive domain mapping
-    domain_map = {
-        # Major national outlets
-        "nytimes.com": "New York Times",
-        "wsj.com": "Wall Street Journal",
-        "washingtonpost.com": "Washington Post",
-        "politico.com": "Politico",
-        "theatlantic.com": "The Atlantic",
-        "bloomberg.com": "Bloomberg",
-        "reuters.com": "Reuters",
-        "apnews.com": "AP News",
-        "cnn.com": "CNN",
-        "foxnews.com": "Fox News",
-        "nbcnews.com": "NBC News",
-        "cbsnews.com": "CBS News",
-        "abcnews.go.com": "ABC News",
-        "usatoday.com": "USA Today",
-        "latimes.com": "Los Angeles Times",
-        "chicagotribune.com": "Chicago Tribune",
-        "bostonglobe.com": "Boston Globe",
-        "sfchronicle.com": "SF Chronicle",
-        "axios.com": "Axios",
-        "thehill.com": "The Hill",
-        "businessinsider.com": "Business Insider",
-        "forbes.com": "Forbes",
-        "fortune.com": "Fortune",
-        "theguardian.com": "The Guardian",
-        "bbc.com": "BBC",
-        "bbc.co.uk": "BBC",
-        "economist.com": "The Economist",
-        "ft.com": "Financial Times",
-        "marketwatch.com": "MarketWatch",
-        "cnbc.com": "CNBC",
-        "npr.org": "NPR",
-        "time.com": "Time",
-        "newyorker.com": "The New Yorker",
-        "vanityfair.com": "Vanity Fair",
-        "rollingstone.com": "Rolling Stone",
-        "vox.com": "Vox",
-        "slate.com": "Slate",
-        "thedailybeast.com": "The Daily Beast",
-        "huffpost.com": "HuffPost",
-        "buzzfeednews.com": "BuzzFeed News",
-        "infobae.com": "Infobae",
-        "nzherald.co.nz": "NZ Herald",
-
-        # McClatchy newspapers
-        "miamiherald.com": "Miami Herald",
-        "sacbee.com": "Sacramento Bee",
-        "charlotteobserver.com": "Charlotte Observer",
-        "kansascity.com": "Kansas City Star",
-        "star-telegram.com": "Fort Worth Star-Telegram",
-        "newsobserver.com": "Raleigh News & Observer",
-        "thestate.com": "The State (SC)",
-        "kentucky.com": "Lexington Herald-Leader",
-        "kansas.com": "Wichita Eagle",
-        "bnd.com": "Belleville News-Democrat",
-        "bradenton.com": "Bradenton Herald",
-        "fresnobee.com": "Fresno Bee",
-        "modbee.com": "Modesto Bee",
-        "sanluisobispo.com": "San Luis Obispo Tribune",
-        "thenewstribune.com": "Tacoma News Tribune",
-        "bellinghamherald.com": "Bellingham Herald",
-        "theolympian.com": "The Olympian",
-        "tri-cityherald.com": "Tri-City Herald",
-        "idahostatesman.com": "Idaho Statesman",
-        "islandpacket.com": "Island Packet",
-        "heraldsun.com": "Durham Herald-Sun",
-        "ledger-enquirer.com": "Columbus Ledger-Enquirer",
-        "macon.com": "Macon Telegraph",
-        "myrtlebeachonline.com": "Myrtle Beach Sun News",
-        "sunherald.com": "Biloxi Sun Herald",
-
-        # Other regional papers
-        "adn.com": "Anchorage Daily News",
-        "seattletimes.com": "Seattle Times",
-        "sfexaminer.com": "SF Examiner",
-        "spokesman.com": "Spokesman-Review",
-        "denverpost.com": "Denver Post",
-        "dallasnews.com": "Dallas Morning News",
-        "houstonchronicle.com": "Houston Chronicle",
-        "ajc.com": "Atlanta Journal-Constitution",
-        "inquirer.com": "Philadelphia Inquirer",
-        "startribune.com": "Minneapolis Star Tribune",
-        "detroitnews.com": "Detroit News",
-        "freep.com": "Detroit Free Press",
-        "jsonline.com": "Milwaukee Journal Sentinel",
-        "dispatch.com": "Columbus Dispatch",
-        "cleveland.com": "Cleveland Plain Dealer",
-        "baltimoresun.com": "Baltimore Sun",
-        "orlandosentinel.com": "Orlando Sentinel",
-        "tampabay.com": "Tampa Bay Times",
-        "sun-sentinel.com": "South Florida Sun-Sentinel",
-        "azcentral.com": "Arizona Republic",
-        "reviewjournal.com": "Las Vegas Review-Journal",
-        "sltrib.com": "Salt Lake Tribune",
-        "oregonlive.com": "The Oregonian",
-
-        # International
-        "telegraph.co.uk": "The Telegraph",
-        "independent.co.uk": "The Independent",
-        "dailymail.co.uk": "Daily Mail",
-        "mirror.co.uk": "Daily Mirror",
-        "thesun.co.uk": "The Sun",
-        "thetimes.co.uk": "The Times (UK)",
-        "globeandmail.com": "Globe and Mail",
-        "torontosun.com": "Toronto Sun",
-        "smh.com.au": "Sydney Morning Herald",
-        "theaustralian.com.au": "The Australian",
-        "irishtimes.com": "Irish Times",
-        "scmp.com": "South China Morning Post",
-        "japantimes.co.jp": "Japan Times",
-        "straitstimes.com": "Straits Times",
-        "haaretz.com": "Haaretz",
-        "jpost.com": "Jerusalem Post",
-        "aljazeera.com": "Al Jazeera",
-        "dw.com": "Deutsche Welle",
-        "france24.com": "France 24",
-        "lemonde.fr": "Le Monde",
-        "spiegel.de": "Der Spiegel",
-        "elpais.com": "El Pais",
-
-        # Business/Finance
-        "barrons.com": "Barron's",
-        "fool.com": "Motley Fool",
-        "investopedia.com": "Investopedia",
-        "seekingalpha.com": "Seeking Alpha",
-        "thestreet.com": "TheStreet",
-        "finance.yahoo.com": "Yahoo Finance",
-        "money.cnn.com": "CNN Money",
-
-        # Tech
-        "techcrunch.com": "TechCrunch",
-        "theverge.com": "The Verge",
-        "wired.com": "Wired",
-        "arstechnica.com": "Ars Technica",
-        "engadget.com": "Engadget",
-        "cnet.com": "CNET",
-        "zdnet.com": "ZDNet",
-        "gizmodo.com": "Gizmodo",
-        "mashable.com": "Mashable",
-        "recode.net": "Recode",
-        "protocol.com": "Protocol",
-
-        # Sports
-        "espn.com": "ESPN",
-        "sports.yahoo.com": "Yahoo Sports",
-        "cbssports.com": "CBS Sports",
-        "si.com": "Sports Illustrated",
-        "theathletic.com": "The Athletic",
-        "bleacherreport.com": "Bleacher Report",
-
-        # Public radio/TV
-        "wlrn.org": "WLRN",
-        "wnyc.org": "WNYC",
-        "kqed.org": "KQED",
-        "wbur.org": "WBUR",
-        "pbs.org": "PBS",
-
-        # Legal/Business news
-        "bloomberglaw.com": "Bloomberg Law",
-        "law.com": "Law.com",
-        "law360.com": "Law360",
-
-        # Accounting/Finance trades
-        "accountingtoday.com": "Accounting Today",
-        "journalofaccountancy.com": "Journal of Accountancy",
-        "cpapracticeadvisor.com": "CPA Practice Advisor",
-        "cfodive.com": "CFO Dive",
-        "cfo.com": "CFO Magazine",
-        "complianceweek.com": "Compliance Week",
-
-        # Professional services / consulting
-        "consultancy.uk": "Consultancy.uk",
-        "consulting.us": "Consulting.us",
-        "hbr.org": "Harvard Business Review",
-        "mckinsey.com": "McKinsey",
-
-        # Regional business journals
-        "bizjournals.com": "The Business Journals",
-
-        # Industry Dive network
-        "hrdive.com": "HR Dive",
-        "supplychaindive.com": "Supply Chain Dive",
-        "ciodive.com": "CIO Dive",
-        "healthcaredive.com": "Healthcare Dive",
-        "marketingdive.com": "Marketing Dive",
-        "retaildive.com": "Retail Dive",
-        "constructiondive.com": "Construction Dive",
-        "bankingdive.com": "Banking Dive",
-        "biopharmadive.com": "BioPharma Dive",
-        "educationdive.com": "Education Dive",
-        "utilitydive.com": "Utility Dive",
-
-        # Other
-        "rp.pl": "Rzeczpospolita",
-        "fnlondon.com": "Financial News London",
-    }
+    # Normalize domain; only a leading "www." is cruft (not e.g. "awww.com")
+    domain = domain.lower().removeprefix("www.")
 
-    if domain in domain_map:
-        return domain_map[domain]
+    if domain in _DOMAIN_MAP:
+        return _DOMAIN_MAP[domain]
 
     # Handle bizjournals subdomains (e.g., dallas.bizjournals.com → Dallas Business Journal)
     if domain.endswith("bizjournals.com") and domain != "bizjournals.com":
         city = domain.split(".")[0].title()
-        return f"{city} Business Journal"
-
-    # Try partial matching for subdomains
-    for known_domain, name in domain_map.items():
-        if domain.endswith(known_domain):
+        return sys.intern(f"{city} Business Journal")
+
+    # Subdomains of a known domain: probe each parent domain, most specific
+    # first ("edition.cnn.com" -> "cnn.com"), one dict lookup per label
+    labels = domain.split(".")
+    for i in range(1, len(labels) - 1):
+        name = _DOMAIN_MAP.get(".".join(labels[i:]))
+        if name:
             return name
 
-    # Fallback: clean up domain intelligently
-    import re
-
-    # Split domain into parts
-    parts = domain.split(".")
-
+    # Fallback: clean up domain intelligently (labels is the split domain)
     # Skip common subdomain prefixes
-    skip_prefixes = {"www", "news", "api", "m", "mobile", "amp", "cdn", "static"}
-    name_parts = [p for p in parts if p.lower() not in skip_prefixes]
+    name_parts = [p for p in labels if p not in _SKIP_PREFIXES]
 
     # Take the main domain name (usually first meaningful part)
     if name_parts:
         # Remove TLD (.com, .org, .co.uk, etc.)
-        if len(name_parts) > 1 and name_parts[-1] in {"com", "org", "net", "edu", "gov", "co", "uk", "io", "ai"}:
+        if len(name_parts) > 1 and name_parts[-1] in _TLDS:
             name_parts = name_parts[:-1]
-        if len(name_parts) > 1 and name_parts[-1] in {"co"}:
+        if len(name_parts) > 1 and name_parts[-1] == "co":
             name_parts = name_parts[:-1]
-        name = name_parts[0] if name_parts else domain.split(".")[0]
+        name = name_parts[0]
     else:
-        name = domain.split(".")[0]
+        name = labels[0]
 
     # Add space before capital letters (for camelCase domains)
-    name = re.sub(r'([a-z])([A-Z])', r'\1 \2', name)
+    name = _CAMEL_CASE_RE.sub(r'\1 \2', name)
     # Replace hyphens and underscores with spaces
     name = name.replace("-", " ").replace("_", " ")
     # Title case
     name = name.title()
 
-    return name
+    return sys.intern(name)
 
 
-async def search_and_get_journalist(name: str) -> Optional[dict]:
-    """Search for a journalist by name. Returns {id, social_links} or None."""
-    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-        api_key = get_api_key()
-        return await search_journalist(client, name, api_key)
+_date = itemgetter("date")
 
 
-async def fetch_articles_since(
-    journalist_id: str,
-    since_date: Optional[str] = None,
-) -> List[dict]:
-    """Fetch articles for a journalist, optionally since a given date.
+def _parse_articles(raw_articles: List[dict]) -> List[dict]:
+    """Parse raw Perigon articles, sorted by date descending.
 
-    Returns parsed article dicts sorted by date descending.
+    Repeated URLs are dropped in the same pass, before they are parsed.
     """
-    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-        api_key = get_api_key()
-        raw_articles = await fetch_articles_by_journalist(
-            client, journalist_id, api_key, from_date_override=since_date
-        )
-
     articles = []
+    seen_urls = set()
     for item in raw_articles:
+        if not isinstance(item, dict):
+            continue
+        url = item.get("url")
+        # Non-string URLs are rejected by parse_article (and may be unhashable)
+        if not isinstance(url, str) or url in seen_urls:
+            continue
         parsed = parse_article(item)
         if parsed:
+            seen_urls.add(url)
             articles.append(parsed)
 
-    articles.sort(key=lambda a: a.get("date", ""), reverse=True)
+    # Perigon already sorts by date, so this is a single linear pass in practice
+    articles.sort(key=_date, reverse=True)
     return articles
+
+
+async def search_journalist_with_articles(
+    name: str,
+) -> Tuple[Optional[dict], List[dict]]:
+    """Cold-start lookup: a journalist's {id, social_links} and past-year articles.
+
+    Once the ID is known, the details and article requests don't depend on
+    each other, so they go out concurrently. Returns (None, []) if Perigon
+    has no such journalist; raises PerigonUnavailable if that can't be told.
+    """
+    client = get_client()
+    api_key = get_api_key()
+    journalist_id = await find_journalist_id(client, name, api_key)
+    if not journalist_id:
+        return None, []
+    journalist, raw_articles = await asyncio.gather(
+        fetch_journalist_details(client, journalist_id, api_key),
+        fetch_articles_by_journalist(client, journalist_id, api_key),
+    )
+
+    if not journalist:
+        raise PerigonUnavailable(f"Details for journalist {journalist_id} unavailable")
+    return journalist, _parse_articles(raw_articles)
+
+
+async def fetch_articles_since(
+    journalist_id: str,
+    since_date: Optional[str] = None,
+) -> List[dict]:
+    """Fetch articles for a journalist, optionally since a given date.
+
+    Returns parsed article dicts sorted by date descending. Raises
+    PerigonUnavailable if the fetch fails.
+    """
+    raw_articles = await fetch_articles_by_journalist(
+        get_client(), journalist_id, get_api_key(), from_date_override=since_date
+    )
+
+    return _parse_articles(raw_articles)
@@ -1,15 +1,13 @@
 """Claude Haiku service for classifying reporter relevance to professional services."""
 
-import json
 import os
+from functools import lru_cache
 from typing import List, Set, Tuple
 
 import anthropic
-from dotenv import load_dotenv
+import orjson
 
 
-load_dotenv()
-
 MODEL = "claude-3-haiku-20240307"
 
 # Keywords for fallback heuristic
@@ -20,15 +18,39 @@ RELEVANCE_KEYWORDS = [
     "restructuring", "litigation", "governance", "fiduciary",
 ]
 
+# Classification prompt; {reporter}, {outlets} and {summaries} are filled per call
+_PROMPT_TEMPLATE = """You are classifying a journalist for a PR tool used by professional services firms (law, accounting, consulting, financial advisory).
+
+Reporter: {reporter}
+Outlets: {outlets}
+
+Recent article summaries:
+{summaries}
 
+Question: Is this reporter relevant to professional services firms? A relevant reporter covers topics like: legal industry, accounting/audit, tax policy, M&A/deals, management consulting, financial regulation, corporate governance, bankruptcy/restructuring, or business topics where professional services firms are key players.
+
+Respond in this exact JSON format:
+{{"relevant": true, "rationale": "One sentence explaining why."}}
+
+If the reporter primarily covers sports, entertainment, lifestyle, weather, local crime, or other unrelated beats, mark them as not relevant."""
+
+
+@lru_cache(maxsize=1)
 def get_client() -> anthropic.Anthropic:
-    """Get Anthropic client."""
+    """Get the shared Anthropic client, reusing its connection pool across calls."""
     api_key = os.getenv("ANTHROPIC_API_KEY")
     if not api_key:
         raise ValueError("ANTHROPIC_API_KEY environment variable not set")
     return anthropic.Anthropic(api_key=api_key)
 
 
+def close_client() -> None:
+    """Close the shared client, if one was created (on application shutdown)."""
+    if get_client.cache_info().currsize:
+        get_client().close()
+        get_client.cache_clear()
+
+
 def classify_reporter(
     reporter_name: str,
     outlets: Set[str],
@@ -44,20 +66,9 @@ def classify_reporter(
     outlets_text = ", ".join(outlets) if outlets else "Unknown"
     summaries_text = "\n".join(f"- {s}" for s in summaries)
 
-    prompt = f"""You are classifying a journalist for a PR tool used by professional services firms (law, accounting, consulting, financial advisory).
-
-Reporter: {reporter_name}
-Outlets: {outlets_text}
-
-Recent article summaries:
-{summaries_text}
-
-Question: Is this reporter relevant to professional services firms? A relevant reporter covers topics like: legal industry, accounting/audit, tax policy, M&A/deals, management consulting, financial regulation, corporate governance, bankruptcy/restructuring, or business topics where professional services firms are key players.
-
-Respond in this exact JSON format:
-{{"relevant": true, "rationale": "One sentence explaining why."}}
-
-If the reporter primarily covers sports, entertainment, lifestyle, weather, local crime, or other unrelated beats, mark them as not relevant."""
+    prompt = _PROMPT_TEMPLATE.format(
+        reporter=reporter_name, outlets=outlets_text, summaries=summaries_text
+    )
 
     try:
         client = get_client()
@@ -72,12 +83,12 @@ If the reporter primarily covers sports, entertainment, lifestyle, weather, loca
         if response_text.startswith("```"):
             response_text = response_text.split("\n", 1)[1].rsplit("```", 1)[0].strip()
 
-        data = json.loads(response_text)
+        data = orjson.loads(response_text)
         relevant = bool(data.get("relevant", False))
         rationale = data.get("rationale", "")
         return relevant, rationale
 
-    except (anthropic.APIError, json.JSONDecodeError, ValueError, KeyError):
+    except (anthropic.APIError, orjson.JSONDecodeError, ValueError, KeyError):
         return _fallback_classify(outlets, article_summaries)
 
 
@@ -86,9 +97,13 @@ def _fallback_classify(
     article_summaries: List[str],
 ) -> Tuple[bool, str]:
     """Keyword-based fallback when Claude API is unavailable."""
-    text = " ".join(article_summaries).lower() + " " + " ".join(outlets).lower()
-    matches = sum(1 for kw in RELEVANCE_KEYWORDS if kw in text)
-
-    if matches >= 3:
-        return True, "Keyword-based classification: multiple professional services terms found in recent coverage."
+    text = " ".join([*article_summaries, *outlets]).lower()
+
+    # Each keyword is one C-level substring search; stop as soon as enough match
+    matches = 0
+    for kw in RELEVANCE_KEYWORDS:
+        if kw in text:
+            matches += 1
+            if matches >= 3:
+                return True, "Keyword-based classification: multiple professional services terms found in recent coverage."
     return False, "Keyword-based classification: few professional services terms found in recent coverage."
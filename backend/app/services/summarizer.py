@@ -1,30 +1,90 @@
 """Claude Haiku summarization service for article headlines."""
 
-import json
+import asyncio
 import os
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 import anthropic
-from dotenv import load_dotenv
+import orjson
 
 from ..db.cache import get_cached_summaries_bulk, set_cached_summaries_bulk
+from .analyzer import most_common_outlet
 
 
-load_dotenv()
-
 # Use Haiku for cost efficiency
 MODEL = "claude-3-haiku-20240307"
 
 
+@lru_cache(maxsize=1)
 def get_client() -> anthropic.Anthropic:
-    """Get Anthropic client."""
+    """Get the shared Anthropic client, reusing its connection pool across calls."""
     api_key = os.getenv("ANTHROPIC_API_KEY")
     if not api_key:
         raise ValueError("ANTHROPIC_API_KEY environment variable not set")
     return anthropic.Anthropic(api_key=api_key)
 
 
+def close_client() -> None:
+    """Close the shared client, if one was created (on application shutdown)."""
+    if get_client.cache_info().currsize:
+        get_client().close()
+        get_client.cache_clear()
+
+
+# One async client per event loop, shared by all summary batches so they
+# reuse its connection pool (connections can't be shared across loops)
+_async_client: Optional[anthropic.AsyncAnthropic] = None
+_async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_async_client() -> anthropic.AsyncAnthropic:
+    """Return the shared async Anthropic client, creating it for the running loop."""
+    global _async_client, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client.is_closed() or _async_client_loop is not loop:
+        api_key = os.getenv("ANTHROPIC_API_KEY")
+        if not api_key:
+            raise ValueError("ANTHROPIC_API_KEY environment variable not set")
+        _async_client = anthropic.AsyncAnthropic(api_key=api_key)
+        _async_client_loop = loop
+    return _async_client
+
+
+async def close_async_client() -> None:
+    """Close the shared async client (on application shutdown)."""
+    global _async_client, _async_client_loop
+    if _async_client is not None:
+        await _async_client.close()
+    _async_client = None
+    _async_client_loop = None
+
+
 MAX_ARTICLES_TO_SUMMARIZE = 20  # Limit to reduce cold-start latency
+MAX_SUMMARY_BATCH_SIZE = 10  # Headlines per request, to avoid token limits
+
+# Bounds on what goes into a prompt, so one malformed article (say, a whole
+# story in the headline field) can't blow up its size
+MAX_PROFILE_ARTICLES = 30
+MAX_PROMPT_HEADLINE_CHARS = 200
+MAX_PROFILE_TOPICS = 5
+
+# Profile prompt; {reporter}, {title_hint} and {articles} are filled per call
+_PROFILE_PROMPT_TEMPLATE = """You are analyzing a journalist's recent article history for a PR professional.
+
+Reporter: {reporter}{title_hint}
+
+Recent articles (one per row):
+{articles}
+
+Based on this data, provide two things:
+
+1. CURRENT OUTLET: Determine the reporter's current primary outlet. Account for syndication — if the same articles appear across multiple papers in the same network (e.g., McClatchy, Gannett), identify the reporter's home paper, not every syndication partner. Give just the outlet name.
+
+2. BIO: Write a 2-3 sentence mini-bio describing what this reporter covers. Write it as prose suitable for a PR professional audience. Do not use bullet points or lists. Focus on their beat, coverage areas, and any notable patterns.
+
+Respond in this exact JSON format:
+{{"current_outlet": "Outlet Name", "reporter_bio": "Two to three sentences about the reporter."}}"""
 
 
 def generate_reporter_profile(
@@ -39,35 +99,23 @@ def generate_reporter_profile(
     if not articles:
         return None, None
 
-    # Build article data for the prompt (limit to 30 most recent)
-    article_lines = []
-    for a in articles[:30]:
-        line = f"- \"{a.get('headline', '')}\" | {a.get('outlet', '')} | {a.get('date', '')}"
-        topics = a.get("topics", [])
-        if topics:
-            line += f" | Topics: {', '.join(topics)}"
-        article_lines.append(line)
+    # Build article data for the prompt (most recent only) as a pipe-delimited
+    # table, so column labels are sent once, not per article
+    article_lines = ["headline | outlet | date | topics"]
+    article_lines += [
+        f"{(a.get('headline') or '')[:MAX_PROMPT_HEADLINE_CHARS]} | {a.get('outlet', '')}"
+        f" | {a.get('date', '')} | {', '.join((a.get('topics') or ())[:MAX_PROFILE_TOPICS])}"
+        for a in articles[:MAX_PROFILE_ARTICLES]
+    ]
     articles_text = "\n".join(article_lines)
 
     title_hint = ""
     if social_links_title:
         title_hint = f"\nKnown title/role: {social_links_title}"
 
-    prompt = f"""You are analyzing a journalist's recent article history for a PR professional.
-
-Reporter: {reporter_name}{title_hint}
-
-Recent articles:
-{articles_text}
-
-Based on this data, provide two things:
-
-1. CURRENT OUTLET: Determine the reporter's current primary outlet. Account for syndication — if the same articles appear across multiple papers in the same network (e.g., McClatchy, Gannett), identify the reporter's home paper, not every syndication partner. Give just the outlet name.
-
-2. BIO: Write a 2-3 sentence mini-bio describing what this reporter covers. Write it as prose suitable for a PR professional audience. Do not use bullet points or lists. Focus on their beat, coverage areas, and any notable patterns.
-
-Respond in this exact JSON format:
-{{"current_outlet": "Outlet Name", "reporter_bio": "Two to three sentences about the reporter."}}"""
+    prompt = _PROFILE_PROMPT_TEMPLATE.format(
+        reporter=reporter_name, title_hint=title_hint, articles=articles_text
+    )
 
     try:
         client = get_client()
@@ -82,40 +130,40 @@ Respond in this exact JSON format:
         if response_text.startswith("```"):
             response_text = response_text.split("\n", 1)[1].rsplit("```", 1)[0].strip()
 
-        data = json.loads(response_text)
+        data = orjson.loads(response_text)
         current_outlet = data.get("current_outlet")
         reporter_bio = data.get("reporter_bio")
 
         return current_outlet, reporter_bio
 
-    except (anthropic.APIError, json.JSONDecodeError, ValueError, KeyError):
+    except (anthropic.APIError, orjson.JSONDecodeError, ValueError, KeyError):
         # Fallback: use most common outlet from recent articles
-        from collections import Counter
-        outlet_counts = Counter(a.get("outlet", "") for a in articles)
-        fallback_outlet = outlet_counts.most_common(1)[0][0] if outlet_counts else None
-        return fallback_outlet, None
+        return most_common_outlet(articles), None
 
 
 async def summarize_headlines(articles: List[dict]) -> List[dict]:
     """Add summaries to articles using Claude Haiku.
 
     Uses caching to avoid redundant API calls.
-    Only summarizes top 20 articles to keep response times fast.
+    Only the first MAX_ARTICLES_TO_SUMMARIZE uncached articles are sent to
+    the model, so pass articles newest first; the rest use their headline.
     """
     if not articles:
         return articles
 
-    # Get URLs that need summarization
+    # Get URLs that need summarization (the cache is synchronous sqlite3,
+    # so it is read and written from worker threads)
     urls = [a["url"] for a in articles]
-    cached_summaries = get_cached_summaries_bulk(urls)
+    cached_summaries = await asyncio.to_thread(get_cached_summaries_bulk, urls)
 
-    # Find which articles need new summaries
+    # Find which articles need new summaries (one lookup per article)
     articles_to_summarize = []
     for article in articles:
-        if article["url"] in cached_summaries:
-            article["summary"] = cached_summaries[article["url"]]
-        else:
+        summary = cached_summaries.get(article["url"])
+        if summary is None:
             articles_to_summarize.append(article)
+        else:
+            article["summary"] = summary
 
     # Limit to top N articles to reduce cold-start latency
     # Remaining articles use headline as summary
@@ -127,23 +175,69 @@ async def summarize_headlines(articles: List[dict]) -> List[dict]:
     if not articles_to_summarize:
         return articles
 
-    # Summarize uncached articles in batch
+    # Summarize uncached articles in batches, all in flight at once so the
+    # wait is one batch latency, not the sum
+    batches = _split_batches(articles_to_summarize)
     try:
-        client = get_client()
-        new_summaries = {}
+        client = get_async_client()
+    except ValueError:
+        results = []
+    else:
+        results = await asyncio.gather(
+            *(_summarize_batch(client, batch) for batch in batches),
+            return_exceptions=True,
+        )
+
+    # An API error only costs its own batch; anything else is re-raised,
+    # but only after the batches that succeeded have been cached
+    new_summaries = {}
+    unexpected = None
+    for batch, result in zip(batches, results):
+        if isinstance(result, BaseException):
+            if unexpected is None and not isinstance(result, anthropic.APIError):
+                unexpected = result
+            continue
+        _apply_summaries(batch, result, new_summaries)
+
+    # Cache new summaries
+    if new_summaries:
+        await asyncio.to_thread(set_cached_summaries_bulk, new_summaries)
+    if unexpected is not None:
+        raise unexpected
+
+    # If summarization fails, use headline as fallback
+    for article in articles_to_summarize:
+        if "summary" not in article or not article["summary"]:
+            article["summary"] = article["headline"][:100]
 
-        # Process in batches of 10 to avoid token limits
-        batch_size = 10
-        for i in range(0, len(articles_to_summarize), batch_size):
-            batch = articles_to_summarize[i:i + batch_size]
+    return articles
 
-            # Build batch prompt
-            headlines_text = "\n".join(
-                f"{j+1}. [{a['outlet']}] {a['headline']}"
-                for j, a in enumerate(batch)
-            )
 
-            prompt = f"""Summarize each of these news article headlines in one concise sentence each.
+def _split_batches(articles: List[dict]) -> List[List[dict]]:
+    """Split into the fewest batches of at most MAX_SUMMARY_BATCH_SIZE, evenly.
+
+    The batches run concurrently, so the largest one sets the wait: 11
+    headlines go out as 6 + 5 rather than 10 + 1.
+    """
+    count = -(-len(articles) // MAX_SUMMARY_BATCH_SIZE)
+    size, extra = divmod(len(articles), count)
+    batches = []
+    start = 0
+    for i in range(count):
+        end = start + size + (i < extra)
+        batches.append(articles[start:end])
+        start = end
+    return batches
+
+
+async def _summarize_batch(client: anthropic.AsyncAnthropic, batch: List[dict]) -> str:
+    """Ask Haiku for one numbered summary per headline; returns the raw response text."""
+    headlines_text = "\n".join(
+        f"{j+1}. [{a['outlet']}] {a['headline'][:MAX_PROMPT_HEADLINE_CHARS]}"
+        for j, a in enumerate(batch)
+    )
+
+    prompt = f"""Summarize each of these news article headlines in one concise sentence each.
 Focus on what the article is about and what beat/topic it covers.
 Write for a PR professional researching the reporter.
 
@@ -151,44 +245,52 @@ Headlines:
 {headlines_text}
 
 Provide exactly {len(batch)} summaries, numbered to match the headlines above.
-Keep each summary to one sentence, under 100 characters if possible."""
-
-            response = client.messages.create(
-                model=MODEL,
-                max_tokens=1024,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            # Parse response - extract summaries
-            response_text = response.content[0].text
-            lines = [l.strip() for l in response_text.strip().split("\n") if l.strip()]
-
-            # Match summaries to articles
-            summary_idx = 0
-            for line in lines:
-                # Skip lines that don't look like numbered summaries
-                if not line[0].isdigit():
-                    continue
-                # Remove number prefix
-                summary = line.lstrip("0123456789.)-: ")
-                if summary and summary_idx < len(batch):
-                    article = batch[summary_idx]
-                    article["summary"] = summary
-                    new_summaries[article["url"]] = summary
-                    summary_idx += 1
-
-            # Handle any articles that didn't get summaries
-            for j in range(summary_idx, len(batch)):
-                batch[j]["summary"] = batch[j]["headline"][:100]
-
-        # Cache new summaries
-        if new_summaries:
-            set_cached_summaries_bulk(new_summaries)
-
-    except (anthropic.APIError, ValueError) as e:
-        # If summarization fails, use headline as fallback
-        for article in articles_to_summarize:
-            if "summary" not in article or not article["summary"]:
-                article["summary"] = article["headline"][:100]
+Keep each summary to one sentence, under 100 characters if possible.
 
-    return articles
+Respond in this exact JSON format:
+{{"summaries": [{{"number": 1, "summary": "One sentence about the article."}}]}}"""
+
+    response = await client.messages.create(
+        model=MODEL,
+        max_tokens=1024,
+        messages=[{"role": "user", "content": prompt}]
+    )
+    return response.content[0].text
+
+
+def _apply_summaries(batch: List[dict], response_text: str, new_summaries: Dict[str, str]) -> None:
+    """Match a batch response's summaries to its articles by number.
+
+    Articles the response skips (or a response that isn't valid JSON) fall
+    back to their headline.
+    """
+    response_text = response_text.strip()
+
+    # Strip markdown code blocks
+    if response_text.startswith("```"):
+        response_text = response_text.split("\n", 1)[1].rsplit("```", 1)[0].strip()
+
+    try:
+        items = orjson.loads(response_text)["summaries"]
+    except (orjson.JSONDecodeError, KeyError, TypeError):
+        items = []
+    if not isinstance(items, list):
+        items = []
+
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        number = item.get("number")
+        summary = item.get("summary")
+        if (
+            isinstance(number, int) and 1 <= number <= len(batch)
+            and isinstance(summary, str) and summary.strip()
+        ):
+            article = batch[number - 1]
+            article["summary"] = summary.strip()
+            new_summaries[article["url"]] = article["summary"]
+
+    # Handle any articles that didn't get summaries
+    for article in batch:
+        if not article.get("summary"):
+            article["summary"] = article["headline"][:100]